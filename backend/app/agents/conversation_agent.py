@@ -16,6 +16,7 @@ class ConversationAgent:
         # Use mock LLM for testing or real OpenAI when you have credits
         if settings.USE_MOCK_LLM:
             self.llm = MockLLM()
+            self.chain = None  # mock path calls the LLM directly
             print("🎭 Using Mock LLM (no API calls)")
         else:
             self.llm = ChatOpenAI(
@@ -24,18 +25,30 @@ class ConversationAgent:
                 api_key=settings.OPENAI_API_KEY
             )
             print("🤖 Using OpenAI GPT-3.5-turbo")
-        
-        # Create conversation chain with memory
-        # ConversationChain uses default prompt that works with chat_history
-        self.chain = ConversationChain(
-            llm=self.llm,
-            memory=self.memory,
-            verbose=False
-        )
-    
+
+            # Create conversation chain with memory
+            # ConversationChain uses default prompt that works with chat_history
+            self.chain = ConversationChain(
+                llm=self.llm,
+                memory=self.memory,
+                verbose=False
+            )
+
     async def process_message(self, message: str) -> str:
         """Process user message and return AI response."""
         try:
+            if self.chain is None:
+                # Mock path: skip ConversationChain's prompt templating and
+                # callback plumbing; the mock only pattern-matches the prompt
+                history = self.memory.load_memory_variables({}).get("history", "")
+                prompt = f"{history}\nHuman: {message}\nAI:"
+                response = self.llm._call(prompt)
+                self.memory.save_context(
+                    {"input": message},
+                    {"output": response}
+                )
+                return response
+
             # Use predict method which is simpler than invoke
             response = self.chain.predict(input=message)
             return response
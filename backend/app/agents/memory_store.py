@@ -1,22 +1,52 @@
-"""In-memory storage for conversation sessions."""
+"""Storage for conversation sessions (Redis-backed or in-memory)."""
+import json
+import time
+from dataclasses import dataclass
 from typing import Dict, Optional
-from langchain.memory import ConversationBufferMemory
-from datetime import datetime
+from langchain.memory import ConversationBufferWindowMemory, ChatMessageHistory
+from datetime import datetime, timezone
+import secrets
 import uuid
 
+from app.config import settings
+
+
+def _iso_from_ns(ns: int) -> str:
+    """Format a nanosecond wall-clock timestamp as a UTC ISO string."""
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat()
+
+
+@dataclass(slots=True)
+class SessionMeta:
+    """Fixed-schema per-session metadata (slots: no per-instance dict)."""
+    created_at: int
+    updated_at: Optional[int] = None
+    message_count: int = 0
+
+
+@dataclass(slots=True)
+class _SessionState:
+    """Memory plus metadata for one session, behind a single dict key.
+
+    Keeping both in one value halves the hash lookups on every path
+    that touches a session, since memory and metadata are always read
+    or written together.
+    """
+    memory: ConversationBufferWindowMemory
+    meta: SessionMeta
+
 
 class MemoryStore:
     """
     Manages conversation memory for multiple sessions.
-    
+
     Uses in-memory storage (dict) for simplicity.
-    In production, this would use Redis or a database.
+    Used when Redis is not configured (see RedisMemoryStore below).
     """
     
     def __init__(self):
         """Initialize the memory store."""
-        self._sessions: Dict[str, ConversationBufferMemory] = {}
-        self._session_metadata: Dict[str, dict] = {}
+        self._sessions: Dict[str, _SessionState] = {}
     
     def get_or_create_session(self, session_id: Optional[str] = None):
         """
@@ -31,19 +61,23 @@ class MemoryStore:
         if session_id is None:
             session_id = self._generate_session_id()
         
-        if session_id not in self._sessions:
-            # Create new memory for this session
-            memory = ConversationBufferMemory(
-                memory_key="history",
-                input_key="input"
+        state = self._sessions.get(session_id)
+        if state is None:
+            # Create new memory for this session, capped to a sliding
+            # window so prompt size stays bounded as the chat grows.
+            # Timestamps are stored as raw nanoseconds (one clock read);
+            # get_session_info converts to ISO strings lazily.
+            state = _SessionState(
+                memory=ConversationBufferWindowMemory(
+                    memory_key="history",
+                    input_key="input",
+                    k=settings.MEMORY_WINDOW
+                ),
+                meta=SessionMeta(created_at=time.time_ns()),
             )
-            self._sessions[session_id] = memory
-            self._session_metadata[session_id] = {
-                "created_at": datetime.utcnow(),
-                "message_count": 0
-            }
-        
-        return session_id, self._sessions[session_id]
+            self._sessions[session_id] = state
+
+        return session_id, state.memory
     
     def save_conversation(self, session_id: str, user_message: str, ai_response: str):
         """
@@ -54,15 +88,15 @@ class MemoryStore:
             user_message: User's message
             ai_response: AI's response
         """
-        if session_id in self._sessions:
-            memory = self._sessions[session_id]
-            memory.save_context(
+        state = self._sessions.get(session_id)
+        if state is not None:
+            state.memory.save_context(
                 {"input": user_message},
                 {"output": ai_response}
             )
             # Update metadata
-            self._session_metadata[session_id]["message_count"] += 1
-            self._session_metadata[session_id]["updated_at"] = datetime.utcnow()
+            state.meta.message_count += 1
+            state.meta.updated_at = time.time_ns()
     
     def get_conversation_history(self, session_id: str) -> list:
         """
@@ -74,11 +108,11 @@ class MemoryStore:
         Returns:
             List of message dictionaries
         """
-        if session_id not in self._sessions:
+        state = self._sessions.get(session_id)
+        if state is None:
             return []
-        
-        memory = self._sessions[session_id]
-        history = memory.load_memory_variables({})
+
+        history = state.memory.load_memory_variables({})
         
         # Get the history string and parse it
         if "history" in history:
@@ -95,9 +129,10 @@ class MemoryStore:
         Args:
             session_id: Session identifier
         """
-        if session_id in self._sessions:
-            self._sessions[session_id].clear()
-            self._session_metadata[session_id]["message_count"] = 0
+        state = self._sessions.get(session_id)
+        if state is not None:
+            state.memory.clear()
+            state.meta.message_count = 0
     
     def delete_session(self, session_id: str):
         """
@@ -106,10 +141,7 @@ class MemoryStore:
         Args:
             session_id: Session identifier
         """
-        if session_id in self._sessions:
-            del self._sessions[session_id]
-        if session_id in self._session_metadata:
-            del self._session_metadata[session_id]
+        self._sessions.pop(session_id, None)
     
     def get_session_info(self, session_id: str) -> Optional[dict]:
         """
@@ -121,18 +153,253 @@ class MemoryStore:
         Returns:
             Session metadata or None if not found
         """
-        return self._session_metadata.get(session_id)
-    
+        state = self._sessions.get(session_id)
+        if state is None:
+            return None
+        meta = state.meta
+
+        # Convert the stored nanosecond timestamps to ISO strings here,
+        # off the chat hot path
+        info = {
+            "created_at": _iso_from_ns(meta.created_at),
+            "message_count": meta.message_count,
+        }
+        if meta.updated_at is not None:
+            info["updated_at"] = _iso_from_ns(meta.updated_at)
+        return info
+
+    def reset(self):
+        """Drop every session and its metadata.
+
+        Used by tests to start from a clean store without reaching
+        into the private dict; clear() keeps the allocated hash
+        table so repeated fill/reset cycles don't churn memory.
+        """
+        self._sessions.clear()
+
     def _generate_session_id(self) -> str:
         """Generate a unique session ID."""
-        return f"session_{uuid.uuid4().hex[:16]}"
-    
+        # token_hex(8) gives the same 16 hex chars as uuid4().hex[:16]
+        # without formatting 32 chars and discarding half
+        return f"session_{secrets.token_hex(8)}"
+
     @property
     def active_sessions(self) -> int:
         """Get count of active sessions."""
         return len(self._sessions)
 
 
-# Global instance
-memory_store = MemoryStore()
+class RedisMemoryStore:
+    """
+    Redis-backed session store with the same interface as MemoryStore.
+
+    Each session is stored as:
+    - memory:{session_id}       hash of serialized turns keyed by ts:{uuid}
+    - memory:{session_id}:idx   sorted set of turn keys scored by timestamp
+    - meta:{session_id}         hash with created_at / message_count metadata
+
+    All keys carry a TTL (refreshed on access) so idle sessions are evicted
+    automatically. Works across multiple workers since no state lives in
+    the process.
+    """
+
+    def __init__(self, redis_url: str, ttl_seconds: int = 3600):
+        """
+        Initialize the Redis-backed store.
+
+        Args:
+            redis_url: Redis connection URL (e.g. redis://localhost:6379/0)
+            ttl_seconds: Idle time before a session is evicted
+        """
+        # Imported here so the redis package is only required when configured
+        import redis
+        self._redis = redis.Redis.from_url(redis_url, decode_responses=True)
+        self._ttl = ttl_seconds
+
+    @staticmethod
+    def _messages_key(session_id: str) -> str:
+        return f"memory:{session_id}"
+
+    @staticmethod
+    def _index_key(session_id: str) -> str:
+        return f"memory:{session_id}:idx"
+
+    @staticmethod
+    def _meta_key(session_id: str) -> str:
+        return f"meta:{session_id}"
+
+    def get_or_create_session(self, session_id: Optional[str] = None):
+        """
+        Get existing session memory or create a new one.
+
+        Args:
+            session_id: Optional session ID. If None, creates a new session.
+
+        Returns:
+            Tuple of (session_id, memory)
+        """
+        if session_id is None:
+            session_id = self._generate_session_id()
+
+        meta_key = self._meta_key(session_id)
+        if not self._redis.exists(meta_key):
+            self._redis.hset(meta_key, mapping={
+                "created_at": datetime.utcnow().isoformat(),
+                "message_count": 0
+            })
+
+        # Refresh TTLs so active sessions stay alive
+        pipe = self._redis.pipeline()
+        pipe.expire(meta_key, self._ttl)
+        pipe.expire(self._messages_key(session_id), self._ttl)
+        pipe.expire(self._index_key(session_id), self._ttl)
+        pipe.execute()
+
+        return session_id, self._load_memory(session_id)
+
+    def _load_memory(self, session_id: str) -> ConversationBufferWindowMemory:
+        """Rebuild windowed conversation memory from the stored turns."""
+        memory = ConversationBufferWindowMemory(
+            memory_key="history",
+            input_key="input",
+            k=settings.MEMORY_WINDOW,
+            chat_memory=ChatMessageHistory()
+        )
+
+        # Turn keys come back in timestamp order from the sorted set
+        turn_keys = self._redis.zrange(self._index_key(session_id), 0, -1)
+        if turn_keys:
+            payloads = self._redis.hmget(self._messages_key(session_id), turn_keys)
+            for payload in payloads:
+                if payload:
+                    turn = json.loads(payload)
+                    memory.chat_memory.add_user_message(turn["input"])
+                    memory.chat_memory.add_ai_message(turn["output"])
+
+        return memory
+
+    def save_conversation(self, session_id: str, user_message: str, ai_response: str):
+        """
+        Save a conversation turn to Redis.
+
+        Args:
+            session_id: Session identifier
+            user_message: User's message
+            ai_response: AI's response
+        """
+        turn_key = f"ts:{uuid.uuid4().hex}"
+        payload = json.dumps({"input": user_message, "output": ai_response})
+
+        # One round-trip: HSET + ZADD + metadata + TTL refresh
+        pipe = self._redis.pipeline()
+        pipe.hset(self._messages_key(session_id), turn_key, payload)
+        pipe.zadd(self._index_key(session_id), {turn_key: time.time()})
+        pipe.hincrby(self._meta_key(session_id), "message_count", 1)
+        pipe.hset(self._meta_key(session_id), "updated_at", datetime.utcnow().isoformat())
+        pipe.expire(self._messages_key(session_id), self._ttl)
+        pipe.expire(self._index_key(session_id), self._ttl)
+        pipe.expire(self._meta_key(session_id), self._ttl)
+        pipe.execute()
+
+    def get_conversation_history(self, session_id: str) -> list:
+        """
+        Get conversation history for a session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            List of message dictionaries
+        """
+        if not self._redis.exists(self._meta_key(session_id)):
+            return []
+
+        memory = self._load_memory(session_id)
+        history = memory.load_memory_variables({})
+
+        if "history" in history and history["history"]:
+            return [{"history": history["history"]}]
+
+        return []
+
+    def clear_session(self, session_id: str):
+        """
+        Clear a session's memory (metadata is kept).
+
+        Args:
+            session_id: Session identifier
+        """
+        self._redis.unlink(
+            self._messages_key(session_id),
+            self._index_key(session_id)
+        )
+        if self._redis.exists(self._meta_key(session_id)):
+            self._redis.hset(self._meta_key(session_id), "message_count", 0)
+
+    def delete_session(self, session_id: str):
+        """
+        Delete a session entirely.
+
+        Args:
+            session_id: Session identifier
+        """
+        # UNLINK reclaims memory asynchronously on the server side
+        self._redis.unlink(
+            self._messages_key(session_id),
+            self._index_key(session_id),
+            self._meta_key(session_id)
+        )
+
+    def get_session_info(self, session_id: str) -> Optional[dict]:
+        """
+        Get metadata about a session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Session metadata or None if not found
+        """
+        meta = self._redis.hgetall(self._meta_key(session_id))
+        if not meta:
+            return None
+
+        meta["message_count"] = int(meta.get("message_count", 0))
+        return meta
+
+    def reset(self):
+        """Drop every session and its metadata.
+
+        Same contract as MemoryStore.reset(): used by tests to start
+        from a clean store through the public interface. Keys are
+        batched into one UNLINK per scan page so the server reclaims
+        them asynchronously.
+        """
+        for pattern in ("meta:*", "memory:*"):
+            batch = []
+            for key in self._redis.scan_iter(match=pattern):
+                batch.append(key)
+                if len(batch) >= 500:
+                    self._redis.unlink(*batch)
+                    batch = []
+            if batch:
+                self._redis.unlink(*batch)
+
+    def _generate_session_id(self) -> str:
+        """Generate a unique session ID."""
+        # token_hex(8) gives the same 16 hex chars as uuid4().hex[:16]
+        # without formatting 32 chars and discarding half
+        return f"session_{secrets.token_hex(8)}"
+
+    @property
+    def active_sessions(self) -> int:
+        """Get count of active sessions."""
+        return sum(1 for _ in self._redis.scan_iter(match="meta:*"))
+
+
+# Global instance - Redis-backed when configured, in-process otherwise
+if settings.REDIS_URL:
+    memory_store = RedisMemoryStore(settings.REDIS_URL, settings.SESSION_TTL_SECONDS)
+else:
+    memory_store = MemoryStore()
 
@@ -1,8 +1,65 @@
 """Mock LLM for testing without OpenAI API."""
+import re
 from typing import Any, List, Optional
 from langchain.llms.base import LLM
 from langchain.callbacks.manager import CallbackManagerForLLMRun
 
+# Precompiled patterns and keyword tuples - compiled/built once at import
+# so the hot _call path does no regex compilation or list construction
+_NAME_RE = re.compile(r"(?:my name is|i'?m|i am)\s+(\w+)", re.IGNORECASE)
+_PRODUCT_KEYWORDS = ("product", "drinkware", "tumbler")
+_OUTLET_KEYWORDS = ("outlet", "location", "store")
+_CALC_OPS = ("calculate", "+", "-", "*", "/")
+_NAME_INTROS = ("my name is", "i'm", "i am")
+_GREETINGS = ("hello", "hi", "hey")
+
+# Trigger keyword -> response category, plus a single alternation that
+# finds every trigger in one scan of the input instead of one substring
+# search per keyword
+_KEYWORD_CATEGORY = {}
+for _kw in _PRODUCT_KEYWORDS:
+    _KEYWORD_CATEGORY[_kw] = "product"
+for _kw in _OUTLET_KEYWORDS:
+    _KEYWORD_CATEGORY[_kw] = "outlet"
+for _kw in _CALC_OPS:
+    _KEYWORD_CATEGORY[_kw] = "calc"
+for _kw in _GREETINGS:
+    _KEYWORD_CATEGORY[_kw] = "greeting"
+
+_DISPATCH_RE = re.compile("|".join(re.escape(kw) for kw in _KEYWORD_CATEGORY))
+
+# Categories checked before the name-introduction fallback, in priority order
+_CATEGORY_PRIORITY = ("product", "outlet", "calc")
+
+
+def _respond_product(current_input: str, current_lower: str) -> str:
+    return "ZUS Coffee offers a range of high-quality drinkware including insulated tumblers, bottles, and mugs. They're perfect for keeping your drinks hot or cold!"
+
+
+def _respond_outlet(current_input: str, current_lower: str) -> str:
+    return "ZUS Coffee has outlets across Malaysia, particularly in Kuala Lumpur and Selangor. I can help you find specific locations!"
+
+
+def _respond_calc(current_input: str, current_lower: str) -> str:
+    if "5+3" in current_input or "5 + 3" in current_input:
+        return "The calculation 5 + 3 equals 8."
+    elif "10*2" in current_input or "10 * 2" in current_input:
+        return "The calculation 10 * 2 equals 20."
+    else:
+        return "I can help you with calculations. What would you like me to calculate?"
+
+
+def _respond_greeting(current_input: str, current_lower: str) -> str:
+    return "Hello! I'm a helpful AI assistant for ZUS Coffee. How can I help you today?"
+
+
+_HANDLERS = {
+    "product": _respond_product,
+    "outlet": _respond_outlet,
+    "calc": _respond_calc,
+    "greeting": _respond_greeting,
+}
+
 
 class MockLLM(LLM):
     """
@@ -42,19 +99,27 @@ class MockLLM(LLM):
         Returns:
             Mock response
         """
-        # Extract just the current human message (last line after "Human:")
-        lines = prompt.split('\n')
+        # Extract the current human message: find the last "Human:" with a
+        # single rfind instead of splitting the prompt into a line list
         current_input = ""
-        for i in range(len(lines)-1, -1, -1):
-            if lines[i].strip().startswith("Human:"):
-                current_input = lines[i].replace("Human:", "").strip()
-                break
-        
-        # If we couldn't extract, use last non-empty line
+        idx = prompt.rfind("\nHuman:")
+        if idx >= 0:
+            start = idx + len("\nHuman:")
+        elif prompt.startswith("Human:"):
+            start = len("Human:")
+        else:
+            start = -1
+
+        if start >= 0:
+            end = prompt.find("\n", start)
+            current_input = prompt[start:end if end != -1 else len(prompt)].strip()
+
+        # Rare fallback (no "Human:" in prompt): last non-empty, non-AI line
         if not current_input:
-            for line in reversed(lines):
-                if line.strip() and not line.strip().startswith("AI:"):
-                    current_input = line.strip()
+            for line in reversed(prompt.split("\n")):
+                line = line.strip()
+                if line and not line.startswith("AI:"):
+                    current_input = line
                     break
         
         current_lower = current_input.lower()
@@ -72,35 +137,29 @@ class MockLLM(LLM):
             else:
                 return "I don't recall you mentioning your name. What is it?"
         
-        # Product questions - check CURRENT input
-        if "product" in current_lower or "drinkware" in current_lower or "tumbler" in current_lower:
-            return "ZUS Coffee offers a range of high-quality drinkware including insulated tumblers, bottles, and mugs. They're perfect for keeping your drinks hot or cold!"
-        
-        # Outlet questions
-        if "outlet" in current_lower or "location" in current_lower or "store" in current_lower:
-            return "ZUS Coffee has outlets across Malaysia, particularly in Kuala Lumpur and Selangor. I can help you find specific locations!"
-        
-        # Calculation requests
-        if any(op in current_lower for op in ["calculate", "+", "-", "*", "/"]) or ("what" in current_lower and "is" in current_lower and any(c.isdigit() for c in current_input)):
-            if "5+3" in current_input or "5 + 3" in current_input:
-                return "The calculation 5 + 3 equals 8."
-            elif "10*2" in current_input or "10 * 2" in current_input:
-                return "The calculation 10 * 2 equals 20."
-            else:
-                return "I can help you with calculations. What would you like me to calculate?"
-        
+        # Single pass over the input: collect every trigger keyword in one
+        # scan, then dispatch through the handler table in priority order
+        matched = {_KEYWORD_CATEGORY[kw] for kw in _DISPATCH_RE.findall(current_lower)}
+
+        # "what is ...<digits>..." also counts as a calculation request
+        if "calc" not in matched and "what" in current_lower and "is" in current_lower and any(c.isdigit() for c in current_input):
+            matched.add("calc")
+
+        for category in _CATEGORY_PRIORITY:
+            if category in matched:
+                return _HANDLERS[category](current_input, current_lower)
+
         # Check for name introduction (anywhere in message)
-        import re
-        if "my name is" in current_lower or "i'm" in current_lower or "i am" in current_lower:
+        if any(intro in current_lower for intro in _NAME_INTROS):
             # Extract name
-            name_match = re.search(r"(?:my name is|i'?m|i am)\s+(\w+)", current_input, re.IGNORECASE)
+            name_match = _NAME_RE.search(current_input)
             if name_match:
                 name = name_match.group(1).capitalize()
                 return f"Hello {name}! Nice to meet you. I'll remember your name. How can I help you today?"
-        
+
         # Greeting responses
-        if any(greeting in current_lower for greeting in ["hello", "hi", "hey"]):
-            return "Hello! I'm a helpful AI assistant for ZUS Coffee. How can I help you today?"
+        if "greeting" in matched:
+            return _HANDLERS["greeting"](current_input, current_lower)
         
         # Default response - cycle through responses
         response = self.responses[self.response_index % len(self.responses)]
@@ -1,4 +1,6 @@
 """ReAct agent with tool calling capabilities."""
+import re
+from functools import lru_cache
 from typing import List, Optional
 from langchain.agents import AgentExecutor, create_react_agent
 from langchain.tools import BaseTool
@@ -8,9 +10,27 @@ from langchain import hub
 
 from app.config import settings
 from app.agents.mock_llm import MockLLM
-from app.tools.calculator import CalculatorTool
-from app.tools.product_search import ProductSearchTool
-from app.tools.outlet_search import OutletSearchTool
+from app.tools.calculator import calculator_tool
+from app.tools.product_search import product_search_tool
+from app.tools.outlet_search import outlet_search_tool
+
+
+# Compiled/built once at import - _simple_tool_dispatch runs these per message
+_MATH_RE = re.compile(r'[\d\s+\-*/().]+')
+_HAS_DIGIT = re.compile(r'\d').search
+_HAS_OP = re.compile(r'[+\-*/]').search
+
+_OUTLET_KEYWORDS = ("outlet", "location", "address", "store", "branch",
+                    "drive-through", "drive-thru", "wifi", "operating hours",
+                    "opening hours", "where", "city", "state")
+_PRODUCT_KEYWORDS = ("product", "tumbler", "bottle", "cup", "mug", "drinkware",
+                     "buy", "purchase", "price", "available", "stock")
+
+
+@lru_cache(maxsize=1)
+def _get_react_prompt():
+    """Pull the shared ReAct prompt once and reuse it across agents."""
+    return hub.pull("hwchase17/react")
 
 
 class ToolAgent:
@@ -41,8 +61,12 @@ class ToolAgent:
             )
             print("🤖 Using OpenAI GPT-3.5-turbo with tools")
         
-        # Initialize tools
-        self.tools = tools or [CalculatorTool(), ProductSearchTool(), OutletSearchTool()]
+        # Initialize tools (shared stateless singletons by default)
+        self.tools = tools or [calculator_tool, product_search_tool, outlet_search_tool]
+        self._tools_by_name = {tool.name: tool for tool in self.tools}
+
+        # Conversation fallback for the no-tool path, built lazily and reused
+        self._conv_agent = None
         
         # For mock LLM, we'll use a simple pattern matcher instead of full ReAct
         # In production with real LLM, we'd use create_react_agent
@@ -51,7 +75,7 @@ class ToolAgent:
         if not self.use_simple_agent:
             # Create ReAct agent with tools (for real LLM)
             try:
-                prompt = hub.pull("hwchase17/react")
+                prompt = _get_react_prompt()
                 self.agent = create_react_agent(self.llm, self.tools, prompt)
                 self.agent_executor = AgentExecutor(
                     agent=self.agent,
@@ -64,6 +88,23 @@ class ToolAgent:
                 print(f"Warning: Could not create ReAct agent: {e}")
                 self.use_simple_agent = True
     
+    def bind_memory(self, memory: ConversationBufferMemory):
+        """
+        Point the agent at a session's current memory.
+
+        Used by the per-session agent cache so a cached agent picks up
+        memory that was rebuilt between turns (e.g. from Redis).
+
+        Args:
+            memory: Conversation memory for the session
+        """
+        self.memory = memory
+        if not self.use_simple_agent:
+            self.agent_executor.memory = memory
+        if self._conv_agent is not None:
+            self._conv_agent.memory = memory
+            self._conv_agent.chain.memory = memory
+
     async def process_message(self, message: str) -> str:
         """
         Process a message with tool calling capability.
@@ -92,62 +133,37 @@ class ToolAgent:
         Simple tool dispatcher for mock LLM.
         Detects tool requests: calculations, product search, etc.
         """
-        import re
-        
         message_lower = message.lower()
         
         # Check for outlet search requests (higher priority than products)
-        outlet_keywords = ["outlet", "location", "address", "store", "branch", 
-                          "drive-through", "drive-thru", "wifi", "operating hours", 
-                          "opening hours", "where", "city", "state"]
-        has_outlet_keyword = any(kw in message_lower for kw in outlet_keywords)
+        has_outlet_keyword = any(kw in message_lower for kw in _OUTLET_KEYWORDS)
         
         if has_outlet_keyword:
             # Use outlet search tool
-            for tool in self.tools:
-                if tool.name == "outlet_search":
-                    result = tool._run(message)
-                    return result
+            return self._tools_by_name["outlet_search"]._run(message)
         
         # Check for product search requests
-        product_keywords = ["product", "tumbler", "bottle", "cup", "mug", "drinkware", 
-                           "buy", "purchase", "price", "available", "stock"]
-        has_product_keyword = any(kw in message_lower for kw in product_keywords)
+        has_product_keyword = any(kw in message_lower for kw in _PRODUCT_KEYWORDS)
         
         if has_product_keyword:
             # Use product search tool
-            for tool in self.tools:
-                if tool.name == "product_search":
-                    result = tool._run(message)
-                    return result
-        
-        # Check if this is a calculation request
-        calc_keywords = ["calculate", "compute", "what is", "solve"]
-        has_calc_keyword = any(kw in message_lower for kw in calc_keywords)
+            return self._tools_by_name["product_search"]._run(message)
         
-        # Look for mathematical expressions (including parentheses)
-        math_pattern = r'([\d\s+\-*/().]+)'
-        # Find all potential math expressions
-        potential_matches = re.findall(math_pattern, message)
-        
-        # Find the longest valid math expression
-        math_match = None
-        longest_expr = ""
-        for match in potential_matches:
-            cleaned = match.strip()
-            # Check if it contains operators and numbers
-            if re.search(r'\d', cleaned) and re.search(r'[+\-*/]', cleaned):
-                if len(cleaned) > len(longest_expr):
-                    longest_expr = cleaned
-                    math_match = True
-        
-        if (has_calc_keyword or math_match) and longest_expr:
+        # Find the longest valid math expression in a single pass
+        # (must contain at least one digit and one operator)
+        longest_expr = max(
+            (m.group().strip() for m in _MATH_RE.finditer(message)
+             if _HAS_DIGIT(m.group()) and _HAS_OP(m.group())),
+            key=len,
+            default=""
+        )
+
+        if longest_expr:
             # Use the longest expression found
             expression = longest_expr.replace(" ", "")
             
             # Use calculator tool
-            calculator = CalculatorTool()
-            result = calculator._run(expression)
+            result = self._tools_by_name["calculator"]._run(expression)
             
             # Save to memory manually (since we're not using ConversationChain)
             self.memory.save_context(
@@ -158,7 +174,22 @@ class ToolAgent:
             return result
         else:
             # No tool needed, use conversation LLM
-            from app.agents.conversation_agent import ConversationAgent
-            conv_agent = ConversationAgent(self.memory)
-            return await conv_agent.process_message(message)
+            if settings.USE_MOCK_LLM:
+                # Call the mock LLM directly with a prebuilt prompt,
+                # skipping ConversationChain prompt/callback plumbing
+                history = self.memory.load_memory_variables({}).get("history", "")
+                prompt = f"{history}\nHuman: {message}\nAI:"
+                response = self.llm._call(prompt)
+                self.memory.save_context(
+                    {"input": message},
+                    {"output": response}
+                )
+                return response
+
+            # Real LLM without a working ReAct agent: fall back to the
+            # conversation chain, built once per agent and reused
+            if self._conv_agent is None:
+                from app.agents.conversation_agent import ConversationAgent
+                self._conv_agent = ConversationAgent(self.memory)
+            return await self._conv_agent.process_message(message)
 
@@ -1,11 +1,86 @@
 """Chat endpoint for conversational AI."""
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+
+from datetime import datetime, timezone
+
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
+from app.config import settings
 from app.models.chat_models import ChatRequest, ChatResponse
 from app.agents.memory_store import memory_store
 from app.agents.tool_agent import ToolAgent
 
 router = APIRouter(prefix="/chat", tags=["Chat"])
 
+# Bounded TTL cache of responses keyed by (history, message) fingerprint.
+# Only used in mock mode, where responses are deterministic - the real
+# LLM samples at temperature 0.7 so its output must not be cached.
+_RESPONSE_CACHE_MAX = 1024
+_RESPONSE_CACHE_TTL = 300  # seconds
+_response_cache: OrderedDict = OrderedDict()
+
+
+def _cache_get(key: str):
+    """Look up a cached response, evicting it if expired."""
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, response = entry
+    if expires_at < time.monotonic():
+        del _response_cache[key]
+        return None
+    _response_cache.move_to_end(key)
+    return response
+
+
+def _cache_put(key: str, response: str):
+    """Store a response, evicting the oldest entries past the size cap."""
+    _response_cache[key] = (time.monotonic() + _RESPONSE_CACHE_TTL, response)
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > _RESPONSE_CACHE_MAX:
+        _response_cache.popitem(last=False)
+
+# LRU cache of one ToolAgent per session so LangChain setup (prompt pull,
+# executor construction, tool instantiation) is amortized across turns.
+# Bounded because sessions can end without the DELETE route ever firing
+# (Redis TTL eviction, abandoned clients) - the least recently used
+# agent is dropped once the cap is hit and simply rebuilt if that
+# session ever comes back.
+_AGENT_CACHE_MAX = 256
+_agent_cache: OrderedDict[str, ToolAgent] = OrderedDict()
+
+
+def _chat_response(response: str, session_id: str) -> ORJSONResponse:
+    """Encode a chat reply directly with orjson.
+
+    Returning a Response makes FastAPI skip re-validating the payload
+    against the response model - the fields are strings we just built,
+    so the extra pydantic-core pass per message buys nothing.
+    ChatResponse stays on the route purely for the OpenAPI schema.
+    """
+    return ORJSONResponse({
+        "response": response,
+        "session_id": session_id,
+        "timestamp": datetime.now(timezone.utc),
+    })
+
+
+def _get_agent(session_id: str, memory) -> ToolAgent:
+    """Get the cached agent for a session, creating it on first use."""
+    agent = _agent_cache.get(session_id)
+    if agent is None:
+        agent = ToolAgent(memory)
+        _agent_cache[session_id] = agent
+        while len(_agent_cache) > _AGENT_CACHE_MAX:
+            _agent_cache.popitem(last=False)
+    else:
+        agent.bind_memory(memory)
+        _agent_cache.move_to_end(session_id)
+    return agent
+
 
 @router.post("/", response_model=ChatResponse)
 async def chat(request: ChatRequest):
@@ -24,23 +99,47 @@ async def chat(request: ChatRequest):
         HTTPException: If there's an error processing the message
     """
     try:
-        # Get or create session
-        session_id, memory = memory_store.get_or_create_session(request.session_id)
-        
-        # Create tool agent for this session (with calculator support)
-        agent = ToolAgent(memory)
-        
+        # Get or create session off the event loop - with the Redis
+        # store this is the heaviest path (EXISTS + TTL pipeline +
+        # ZRANGE/HMGET to rebuild the history)
+        session_id, memory = await asyncio.to_thread(
+            memory_store.get_or_create_session, request.session_id
+        )
+
+        # Mock mode: identical (history, message) pairs short-circuit the agent
+        cache_key = None
+        if settings.USE_MOCK_LLM:
+            history = memory.load_memory_variables({}).get("history", "")
+            cache_key = hashlib.blake2b(
+                f"{history}\x00{request.message}".encode(), digest_size=16
+            ).hexdigest()
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                # Same off-loop save as the miss path below - with the
+                # Redis store this is a pipeline round-trip
+                await asyncio.to_thread(
+                    memory_store.save_conversation,
+                    session_id, request.message, cached
+                )
+                return _chat_response(cached, session_id)
+
+        # Get the cached tool agent for this session (with calculator support)
+        agent = _get_agent(session_id, memory)
+
         # Process message
         ai_response = await agent.process_message(request.message)
+
+        if cache_key is not None:
+            _cache_put(cache_key, ai_response)
         
-        # Save to memory store
-        memory_store.save_conversation(session_id, request.message, ai_response)
+        # Save to memory store off the event loop - with the Redis store
+        # this is a network round-trip that would otherwise block the loop
+        await asyncio.to_thread(
+            memory_store.save_conversation, session_id, request.message, ai_response
+        )
         
         # Return response
-        return ChatResponse(
-            response=ai_response,
-            session_id=session_id
-        )
+        return _chat_response(ai_response, session_id)
         
     except Exception as e:
         print(f"Error in chat endpoint: {e}")
@@ -61,8 +160,13 @@ async def get_history(session_id: str):
     Returns:
         Conversation history
     """
-    history = memory_store.get_conversation_history(session_id)
-    session_info = memory_store.get_session_info(session_id)
+    # Both reads are Redis round-trips when that store is configured
+    history = await asyncio.to_thread(
+        memory_store.get_conversation_history, session_id
+    )
+    session_info = await asyncio.to_thread(
+        memory_store.get_session_info, session_id
+    )
     
     if not history and not session_info:
         raise HTTPException(status_code=404, detail="Session not found")
@@ -86,6 +190,7 @@ async def delete_session(session_id: str):
         Success message
     """
     memory_store.delete_session(session_id)
+    _agent_cache.pop(session_id, None)
     return {"message": f"Session {session_id} deleted successfully"}
 
 
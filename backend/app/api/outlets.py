@@ -1,6 +1,9 @@
 """API endpoints for outlet search using Text2SQL."""
-from fastapi import APIRouter, HTTPException
-from typing import List
+import re
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from pydantic import TypeAdapter
+from typing import List, Optional, Tuple
 
 from app.models.outlet_models import OutletSearchRequest, OutletSearchResponse, OutletResponse
 from app.text2sql.query_generator import get_text2sql_generator
@@ -8,6 +11,50 @@ from app.db.database import db
 
 router = APIRouter(prefix="/outlets", tags=["Outlets"])
 
+# Validates a whole result set in one pass instead of one
+# OutletResponse(...) call per row
+_OUTLET_LIST_ADAPTER = TypeAdapter(List[OutletResponse])
+
+# Obvious injection markers. The generator is already safe (location
+# whitelist + parameterized SQL), so this is a fast-path: queries that
+# can only ever produce zero results are answered without running the
+# Text2SQL dispatch or touching the database at all. Kept deliberately
+# narrow - apostrophes ("What's ...") and everyday words like "update"
+# or "delete" appear in legitimate questions, so only statement
+# separators, comment markers and unambiguous SQL keywords count.
+_INJECTION_RE = re.compile(r";|--|\b(?:drop\s+table|insert\s+into|alter\s+table|union\s+select)\b", re.IGNORECASE)
+
+# Module-level SQL constants: identical query text on every call means
+# the connection's prepared-statement cache is always hit
+_SQL_ALL_OUTLETS = """
+    SELECT outlet_id, outlet_name, address, city, state, postcode,
+           latitude, longitude, phone, operating_hours,
+           has_drive_thru, has_wifi, seating_capacity, opening_date
+    FROM outlets
+    ORDER BY state, city, outlet_name
+"""
+
+_SQL_OUTLET_BY_ID = """
+    SELECT outlet_id, outlet_name, address, city, state, postcode,
+           latitude, longitude, phone, operating_hours,
+           has_drive_thru, has_wifi, seating_capacity, opening_date
+    FROM outlets
+    WHERE outlet_id = ?
+"""
+
+# Cached serialized /outlets/ payload. The catalog only changes through
+# the ingest script, so the bytes are stable for a process lifetime;
+# invalidate_catalog_cache() resets it after any in-process rewrite.
+_catalog_cache: Optional[Tuple[int, bytes]] = None
+_catalog_version = 0
+
+
+def invalidate_catalog_cache():
+    """Drop the cached catalog payload (call after modifying outlets)."""
+    global _catalog_cache, _catalog_version
+    _catalog_cache = None
+    _catalog_version += 1
+
 
 @router.post("/search", response_model=OutletSearchResponse)
 async def search_outlets(request: OutletSearchRequest):
@@ -25,49 +72,46 @@ async def search_outlets(request: OutletSearchRequest):
     - "What are the operating hours for SS2 outlet?"
     """
     try:
+        # Short-circuit queries carrying obvious injection markers -
+        # they always resolve to zero results, so skip SQL generation
+        # and execution entirely
+        if _INJECTION_RE.search(request.query):
+            return OutletSearchResponse(
+                query=request.query,
+                sql_generated="",
+                results=[],
+                total_results=0,
+                query_metadata={"query_type": "rejected", "valid": False}
+            )
+
         # Generate SQL from natural language
         text2sql = get_text2sql_generator()
         sql, params, metadata = text2sql.generate_sql(request.query)
+
+        # Execute query off the event loop (sqlite3 blocks)
+        results = await db.fetch_all(sql, params)
         
-        # Execute query
-        with db.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(sql, params)
-            results = cursor.fetchall()
-        
-        # Convert to Pydantic models
-        outlet_responses = []
+        # Count queries return a single aggregate row, not outlet rows
+        if metadata.get("query_type") == "count":
+            count = results[0]["count"] if results else 0
+            return OutletSearchResponse(
+                query=request.query,
+                sql_generated=sql.strip(),
+                results=[],
+                total_results=count,
+                query_metadata=metadata
+            )
+
+        # Batch-validate the whole result set in one TypeAdapter pass.
+        # Search queries select a subset of columns, so fill required gaps.
+        rows = []
         for row in results:
-            # Handle both dict and tuple results
-            if isinstance(row, dict):
-                outlet_responses.append(OutletResponse(**row))
-            else:
-                # For count queries, handle differently
-                if metadata.get("query_type") == "count":
-                    # Return empty list with metadata
-                    count = row[0]
-                    return OutletSearchResponse(
-                        query=request.query,
-                        sql_generated=sql.strip(),
-                        results=[],
-                        total_results=count,
-                        query_metadata=metadata
-                    )
-                
-                # For other queries, map tuple to OutletResponse
-                outlet_responses.append(OutletResponse(
-                    outlet_id=row[0] if len(row) > 0 else "",
-                    outlet_name=row[1] if len(row) > 1 else "",
-                    address=row[2] if len(row) > 2 else "",
-                    city=row[3] if len(row) > 3 else "",
-                    state=row[4] if len(row) > 4 else "",
-                    postcode="",  # Not in select
-                    phone=row[5] if len(row) > 5 else None,
-                    operating_hours=row[6] if len(row) > 6 else None,
-                    has_drive_thru=bool(row[7]) if len(row) > 7 else False,
-                    has_wifi=bool(row[8]) if len(row) > 8 else False,
-                ))
-        
+            data = dict(row)
+            data.setdefault("postcode", "")
+            data.setdefault("state", "")
+            rows.append(data)
+        outlet_responses = _OUTLET_LIST_ADAPTER.validate_python(rows)
+
         return OutletSearchResponse(
             query=request.query,
             sql_generated=sql.strip(),
@@ -80,47 +124,35 @@ async def search_outlets(request: OutletSearchRequest):
 
 
 @router.get("/", response_model=List[OutletResponse])
-async def get_all_outlets():
+async def get_all_outlets(request: Request):
     """
     Get all available outlets.
-    
-    Returns the complete outlet catalog with all details.
+
+    Returns the complete outlet catalog with all details. The serialized
+    payload is cached and served with an ETag, so repeat calls skip the
+    database, validation and serialization entirely.
     """
     try:
-        with db.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT outlet_id, outlet_name, address, city, state, postcode,
-                       latitude, longitude, phone, operating_hours,
-                       has_drive_thru, has_wifi, seating_capacity, opening_date
-                FROM outlets
-                ORDER BY state, city, outlet_name
-            """)
-            results = cursor.fetchall()
-        
-        outlets = []
-        for row in results:
-            if isinstance(row, dict):
-                outlets.append(OutletResponse(**row))
-            else:
-                outlets.append(OutletResponse(
-                    outlet_id=row[0],
-                    outlet_name=row[1],
-                    address=row[2],
-                    city=row[3],
-                    state=row[4],
-                    postcode=row[5],
-                    latitude=row[6],
-                    longitude=row[7],
-                    phone=row[8],
-                    operating_hours=row[9],
-                    has_drive_thru=bool(row[10]),
-                    has_wifi=bool(row[11]),
-                    seating_capacity=row[12],
-                    opening_date=row[13]
-                ))
-        
-        return outlets
+        global _catalog_cache
+        if _catalog_cache is None:
+            results = await db.fetch_all(_SQL_ALL_OUTLETS)
+
+            # One Rust-side validation pass over the whole catalog
+            outlets = _OUTLET_LIST_ADAPTER.validate_python(
+                [dict(row) for row in results]
+            )
+            _catalog_cache = (_catalog_version, _OUTLET_LIST_ADAPTER.dump_json(outlets))
+
+        version, payload = _catalog_cache
+        etag = f'W/"{version}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304)
+
+        return Response(
+            content=payload,
+            media_type="application/json",
+            headers={"ETag": etag}
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching outlets: {str(e)}")
 
@@ -134,39 +166,12 @@ async def get_outlet_by_id(outlet_id: str):
         outlet_id: Outlet ID (e.g., 'OUT001')
     """
     try:
-        with db.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT outlet_id, outlet_name, address, city, state, postcode,
-                       latitude, longitude, phone, operating_hours,
-                       has_drive_thru, has_wifi, seating_capacity, opening_date
-                FROM outlets
-                WHERE outlet_id = ?
-            """, (outlet_id,))
-            row = cursor.fetchone()
-        
+        row = await db.fetch_one(_SQL_OUTLET_BY_ID, (outlet_id,))
+
         if not row:
             raise HTTPException(status_code=404, detail=f"Outlet with ID '{outlet_id}' not found")
-        
-        if isinstance(row, dict):
-            return OutletResponse(**row)
-        else:
-            return OutletResponse(
-                outlet_id=row[0],
-                outlet_name=row[1],
-                address=row[2],
-                city=row[3],
-                state=row[4],
-                postcode=row[5],
-                latitude=row[6],
-                longitude=row[7],
-                phone=row[8],
-                operating_hours=row[9],
-                has_drive_thru=bool(row[10]),
-                has_wifi=bool(row[11]),
-                seating_capacity=row[12],
-                opening_date=row[13]
-            )
+
+        return OutletResponse(**dict(row))
     except HTTPException:
         raise
     except Exception as e:
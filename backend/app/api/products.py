@@ -1,5 +1,6 @@
 """API endpoints for product search using RAG."""
 from fastapi import APIRouter, HTTPException
+from pydantic import TypeAdapter
 from typing import List
 
 from app.models.product_models import ProductSearchRequest, ProductSearchResponse, ProductResponse
@@ -7,6 +8,10 @@ from app.rag.simple_embedder import get_vector_store
 
 router = APIRouter(prefix="/products", tags=["Products"])
 
+# Validates a whole product list in one pass instead of one
+# ProductResponse(...) call per item
+_PRODUCT_LIST_ADAPTER = TypeAdapter(List[ProductResponse])
+
 
 @router.post("/search", response_model=ProductSearchResponse)
 async def search_products(request: ProductSearchRequest):
@@ -26,9 +31,9 @@ async def search_products(request: ProductSearchRequest):
         vector_store = get_vector_store()
         results = vector_store.search(request.query, top_k=request.top_k)
         
-        # Convert to Pydantic models
-        product_responses = [ProductResponse(**product) for product in results]
-        
+        # Batch-validate the result list in one TypeAdapter pass
+        product_responses = _PRODUCT_LIST_ADAPTER.validate_python(results)
+
         return ProductSearchResponse(
             query=request.query,
             results=product_responses,
@@ -49,7 +54,7 @@ async def get_all_products():
         vector_store = get_vector_store()
         products = vector_store.get_all_products()
         
-        return [ProductResponse(**product, similarity_score=None) for product in products]
+        return _PRODUCT_LIST_ADAPTER.validate_python(products)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching products: {str(e)}")
 
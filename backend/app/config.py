@@ -1,7 +1,7 @@
 """Application configuration and settings."""
+from functools import cached_property, lru_cache
 from pydantic_settings import BaseSettings
 from typing import List
-import os
 from pathlib import Path
 
 
@@ -16,6 +16,13 @@ class Settings(BaseSettings):
     
     # Vector Store
     VECTOR_STORE_PATH: str = "./data/vector_store"
+
+    # Session storage - Redis is used when a URL is set, in-process dict otherwise
+    REDIS_URL: str = ""
+    SESSION_TTL_SECONDS: int = 3600
+
+    # Conversation turns kept in the prompt window per session
+    MEMORY_WINDOW: int = 10
     
     # Application
     APP_NAME: str = "ConvoSage"
@@ -30,9 +37,9 @@ class Settings(BaseSettings):
     # Development - Use mock LLM instead of OpenAI
     USE_MOCK_LLM: bool = True  # Set to False when you have OpenAI credits
     
-    @property
+    @cached_property
     def cors_origins_list(self) -> List[str]:
-        """Parse CORS_ORIGINS string into a list."""
+        """Parse CORS_ORIGINS string into a list (computed once per instance)."""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
     
     class Config:
@@ -41,6 +48,16 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
+@lru_cache()
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance.
+
+    Construction reads and validates the .env file, so it is done once
+    and cached; use this in dependencies so tests can override it.
+    """
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
 
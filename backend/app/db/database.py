@@ -1,5 +1,8 @@
 """Database connection and setup for SQLite."""
+import asyncio
+import queue
 import sqlite3
+import threading
 from pathlib import Path
 from typing import Optional
 from contextlib import contextmanager
@@ -10,41 +13,130 @@ from app.config import settings
 class Database:
     """
     SQLite database manager for ZUS Coffee outlets.
-    Handles connection pooling and provides context managers for transactions.
+    Holds one WAL-mode writer connection plus a pool of read-only
+    connections for the read-heavy outlet query workload.
     """
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[str] = None, pool_size: int = 8):
         """
         Initialize database manager.
-        
+
         Args:
             db_path: Path to SQLite database file. Defaults to config setting.
+            pool_size: Number of pre-opened read-only pooled connections.
         """
         self.db_path = db_path or settings.DATABASE_URL.replace("sqlite:///", "")
         # Ensure the database directory exists
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
+        # Single writer: opening it first also creates the database file,
+        # which the read-only connections below need to exist
+        self._writer = self._open_connection()
+        self._writer_lock = threading.Lock()
+
+        # Pre-open read-only connections once so requests skip connect +
+        # PRAGMA setup; mode=ro skips write-lock bookkeeping entirely
+        self._readers: queue.Queue = queue.Queue(maxsize=pool_size)
+        for _ in range(pool_size):
+            self._readers.put(self._open_connection(readonly=True))
+
+    def _open_connection(self, readonly: bool = False) -> sqlite3.Connection:
+        """Open a connection with WAL mode and read-tuned PRAGMAs applied."""
+        # A larger statement cache keeps the fixed outlet queries prepared
+        if readonly:
+            conn = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro", uri=True,
+                check_same_thread=False, cached_statements=256
+            )
+        else:
+            conn = sqlite3.connect(
+                self.db_path, check_same_thread=False, cached_statements=256
+            )
+            # WAL lets readers proceed while a writer commits; NORMAL sync
+            # is safe with WAL and skips an fsync per transaction. Journal
+            # mode is a property of the file, so setting it on the writer
+            # covers the readers too.
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.row_factory = sqlite3.Row  # Enable dict-like access to rows
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # 64MB page cache per connection, kept warm for the process lifetime
+        conn.execute("PRAGMA cache_size=-64000")
+        return conn
+
     @contextmanager
     def get_connection(self):
         """
-        Context manager for database connections.
+        Context manager for the writer connection.
         Automatically commits on success and rolls back on error.
-        
+
         Usage:
             with db.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("SELECT * FROM outlets")
+                cursor.execute("INSERT INTO outlets ...")
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable dict-like access to rows
+        with self._writer_lock:
+            try:
+                yield self._writer
+                self._writer.commit()
+            except Exception as e:
+                self._writer.rollback()
+                raise e
+
+    @contextmanager
+    def get_read_connection(self):
+        """
+        Context manager for a pooled read-only connection.
+        No commit/rollback - these connections cannot write.
+        """
+        conn = self._readers.get()
         try:
             yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            raise e
         finally:
-            conn.close()
+            self._readers.put(conn)
+
+    def _fetch_all_sync(self, sql: str, params=()):
+        """Run a query to completion on the calling (worker) thread."""
+        with self.get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+
+    def _fetch_one_sync(self, sql: str, params=()):
+        """Fetch a single row on the calling (worker) thread."""
+        with self.get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            return cursor.fetchone()
+
+    async def fetch_all(self, sql: str, params=()):
+        """
+        Async query returning all rows.
+
+        Runs the blocking sqlite3 work on a worker thread so async
+        handlers never stall the event loop.
+
+        Args:
+            sql: SQL query string
+            params: Query parameters
+
+        Returns:
+            List of sqlite3.Row results
+        """
+        return await asyncio.to_thread(self._fetch_all_sync, sql, params)
+
+    async def fetch_one(self, sql: str, params=()):
+        """
+        Async query returning the first row (or None).
+
+        Args:
+            sql: SQL query string
+            params: Query parameters
+
+        Returns:
+            A sqlite3.Row or None
+        """
+        return await asyncio.to_thread(self._fetch_one_sync, sql, params)
 
     def init_db(self):
         """
@@ -72,10 +164,23 @@ class Database:
                     seating_capacity INTEGER,
                     opening_date DATE,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    city_lower TEXT GENERATED ALWAYS AS (LOWER(city)) VIRTUAL,
+                    state_lower TEXT GENERATED ALWAYS AS (LOWER(state)) VIRTUAL
                 )
             """)
 
+            # Migrate databases created before the generated columns
+            # existed; duplicate-column errors mean nothing to do
+            for column, source in (("city_lower", "city"), ("state_lower", "state")):
+                try:
+                    cursor.execute(
+                        f"ALTER TABLE outlets ADD COLUMN {column} TEXT "
+                        f"GENERATED ALWAYS AS (LOWER({source})) VIRTUAL"
+                    )
+                except sqlite3.OperationalError:
+                    pass
+
             # Create index on city and state for faster queries
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_outlets_city 
@@ -88,10 +193,37 @@ class Database:
             """)
 
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_outlets_drive_thru 
+                CREATE INDEX IF NOT EXISTS idx_outlets_drive_thru
                 ON outlets(has_drive_thru)
             """)
 
+            # Text2SQL queries usually combine state+city (and often a
+            # feature flag); a composite index turns that into one index
+            # seek instead of index-then-filter over a single column
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_outlets_state_city_dt
+                ON outlets(state, city, has_drive_thru)
+            """)
+
+            # NL queries match city case-insensitively (LIKE / lowered
+            # input), which a case-sensitive index can't serve
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_outlets_city_nocase
+                ON outlets(city COLLATE NOCASE)
+            """)
+
+            # Location equality goes through the pre-lowered generated
+            # columns; indexing them turns LOWER()-per-row scans into seeks
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_outlets_city_lower
+                ON outlets(city_lower)
+            """)
+
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_outlets_state_lower
+                ON outlets(state_lower)
+            """)
+
             print("✅ Database schema initialized successfully")
 
     def drop_all_tables(self):
@@ -114,7 +246,7 @@ class Database:
         Returns:
             Number of records
         """
-        with self.get_connection() as conn:
+        with self.get_read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
             return cursor.fetchone()[0]
@@ -1,16 +1,40 @@
 """FastAPI application entry point."""
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.config import settings
 from app.middleware.error_handlers import register_error_handlers
 from app.middleware.rate_limit import rate_limiter
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the product vector store in the background at startup.
+
+    Building the store (load + fit + embed the catalog) is the slowest
+    part of boot; running it on a worker thread lets uvicorn start
+    serving immediately while the first /products call finds the store
+    already built.
+    """
+    from app.rag.simple_embedder import get_vector_store
+    warmup = asyncio.create_task(asyncio.to_thread(get_vector_store))
+    yield
+    if not warmup.done():
+        warmup.cancel()
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.APP_NAME,
     description="A conversational AI chatbot with agentic planning, RAG, and Text2SQL capabilities",
     version="0.1.0",
     debug=settings.DEBUG,
+    # orjson serializes the large catalog responses at C speed
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Register custom error handlers
@@ -23,6 +47,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let browsers cache preflight results for 24h instead of sending
+    # an OPTIONS round-trip before every cross-origin request
+    max_age=86400,
 )
 
 # Add rate limiting middleware
@@ -1,6 +1,6 @@
 """Custom error handlers and exception middleware for FastAPI."""
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 import logging
@@ -30,18 +30,17 @@ class ErrorResponse:
         Returns:
             Formatted error dictionary
         """
-        response = {
-            "error": {
-                "code": error_code,
-                "message": message,
-                "status": status_code
-            }
+        # Single dict display with the dynamic fields spliced in - no
+        # intermediate dicts or conditional mutation on the common path
+        error = {
+            "code": error_code,
+            "message": message,
+            "status": status_code
         }
-        
         if details:
-            response["error"]["details"] = details
-        
-        return response
+            error["details"] = details
+
+        return {"error": error}
 
 
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -60,7 +59,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     
     logger.warning(f"Validation error on {request.url.path}: {field_errors}")
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content=ErrorResponse.format_error(
             error_code="VALIDATION_ERROR",
@@ -79,7 +78,7 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     """
     logger.warning(f"HTTP {exc.status_code} on {request.url.path}: {exc.detail}")
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=ErrorResponse.format_error(
             error_code=f"HTTP_{exc.status_code}",
@@ -96,17 +95,21 @@ async def general_exception_handler(request: Request, exc: Exception):
     Logs the full error and returns a safe message to the user.
     """
     logger.error(f"Unhandled exception on {request.url.path}: {exc}", exc_info=True)
-    
-    return JSONResponse(
+
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=ErrorResponse.format_error(
-            error_code="INTERNAL_ERROR",
-            message="An unexpected error occurred. Please try again later.",
-            status_code=500
-        )
+        content=_INTERNAL_ERROR_CONTENT
     )
 
 
+# The 500 payload is fully static, so format it once at import time
+_INTERNAL_ERROR_CONTENT = ErrorResponse.format_error(
+    error_code="INTERNAL_ERROR",
+    message="An unexpected error occurred. Please try again later.",
+    status_code=500
+)
+
+
 def register_error_handlers(app):
     """
     Register all custom error handlers with the FastAPI app.
@@ -1,11 +1,15 @@
 """Simple rate limiting middleware."""
 from fastapi import Request, HTTPException, status
-from datetime import datetime, timedelta
 from collections import defaultdict
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# Built once: O(1) membership checks with no per-request list allocation
+_SKIP_PATHS = frozenset({"/health", "/"})
+_LOCAL_CLIENTS = frozenset({"testclient", "127.0.0.1", "localhost"})
+
 
 class RateLimiter:
     """
@@ -24,56 +28,70 @@ class RateLimiter:
         """
         self.requests_per_minute = requests_per_minute
         self.requests_per_hour = requests_per_hour
-        
-        # Storage: {ip: [(timestamp, count), ...]}
-        self._minute_buckets = defaultdict(list)
-        self._hour_buckets = defaultdict(list)
-    
-    def _clean_old_entries(self, ip: str):
-        """Remove expired entries."""
-        now = datetime.now()
-        
-        # Clean minute buckets (older than 1 minute)
-        minute_ago = now - timedelta(minutes=1)
-        self._minute_buckets[ip] = [
-            (ts, count) for ts, count in self._minute_buckets[ip]
-            if ts > minute_ago
-        ]
-        
-        # Clean hour buckets (older than 1 hour)
-        hour_ago = now - timedelta(hours=1)
-        self._hour_buckets[ip] = [
-            (ts, count) for ts, count in self._hour_buckets[ip]
-            if ts > hour_ago
-        ]
-    
+
+        # Token buckets: {ip: [tokens, last_refill_ts]}. O(1) time and
+        # two floats of memory per IP per window, regardless of traffic,
+        # instead of one stored timestamp per request.
+        self._minute_buckets = defaultdict(
+            lambda: [float(requests_per_minute), time.monotonic()]
+        )
+        self._hour_buckets = defaultdict(
+            lambda: [float(requests_per_hour), time.monotonic()]
+        )
+        # Sweep idle IPs periodically so a port scan / botnet can't grow
+        # the dicts forever; an idle bucket is fully refilled, so dropping
+        # it is indistinguishable from keeping it
+        self._sweep_after = self._SWEEP_INTERVAL
+
+    # Requests between idle-IP sweeps; amortizes eviction cost to ~0
+    _SWEEP_INTERVAL = 4096
+
+    @staticmethod
+    def _sweep(buckets: dict, window: float, now: float):
+        """Drop buckets idle longer than their window (fully refilled)."""
+        cutoff = now - window
+        idle = [ip for ip, bucket in buckets.items() if bucket[1] < cutoff]
+        for ip in idle:
+            del buckets[ip]
+
+    @staticmethod
+    def _take_token(bucket: list, capacity: int, window: float, now: float) -> bool:
+        """Refill a bucket for elapsed time, then consume one token if available."""
+        tokens, last_refill = bucket
+        tokens = min(float(capacity), tokens + (now - last_refill) * capacity / window)
+        if tokens < 1.0:
+            bucket[0] = tokens
+            bucket[1] = now
+            return False
+        bucket[0] = tokens - 1.0
+        bucket[1] = now
+        return True
+
     def check_rate_limit(self, ip: str) -> tuple[bool, str]:
         """
         Check if request is within rate limits.
-        
+
         Args:
             ip: Client IP address
-            
+
         Returns:
             Tuple of (allowed: bool, error_message: str)
         """
-        self._clean_old_entries(ip)
-        now = datetime.now()
-        
-        # Count requests in last minute
-        minute_count = sum(count for _, count in self._minute_buckets[ip])
-        if minute_count >= self.requests_per_minute:
+        # monotonic() is immune to wall-clock jumps and cheaper than datetime
+        now = time.monotonic()
+
+        self._sweep_after -= 1
+        if self._sweep_after <= 0:
+            self._sweep_after = self._SWEEP_INTERVAL
+            self._sweep(self._minute_buckets, 60.0, now)
+            self._sweep(self._hour_buckets, 3600.0, now)
+
+        if not self._take_token(self._minute_buckets[ip], self.requests_per_minute, 60.0, now):
             return False, f"Rate limit exceeded: {self.requests_per_minute} requests per minute"
-        
-        # Count requests in last hour
-        hour_count = sum(count for _, count in self._hour_buckets[ip])
-        if hour_count >= self.requests_per_hour:
+
+        if not self._take_token(self._hour_buckets[ip], self.requests_per_hour, 3600.0, now):
             return False, f"Rate limit exceeded: {self.requests_per_hour} requests per hour"
-        
-        # Add this request
-        self._minute_buckets[ip].append((now, 1))
-        self._hour_buckets[ip].append((now, 1))
-        
+
         return True, ""
     
     async def __call__(self, request: Request, call_next):
@@ -82,11 +100,11 @@ class RateLimiter:
         client_ip = request.client.host
         
         # Skip rate limiting for health checks
-        if request.url.path in ["/health", "/"]:
+        if request.url.path in _SKIP_PATHS:
             return await call_next(request)
-        
+
         # Skip rate limiting for test client (localhost)
-        if client_ip in ["testclient", "127.0.0.1", "localhost"]:
+        if client_ip in _LOCAL_CLIENTS:
             response = await call_next(request)
             response.headers["X-RateLimit-Disabled"] = "test-mode"
             return response
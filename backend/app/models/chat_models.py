@@ -1,27 +1,27 @@
 """Pydantic models for chat endpoints."""
-from dataclasses import field
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional
-from datetime import datetime
+from pydantic import BaseModel, Field, StringConstraints
+from typing import Annotated, Optional
+from datetime import datetime, timezone
+
+
+def _utc_now() -> datetime:
+    """Timezone-aware UTC now (datetime.utcnow is deprecated and slower)."""
+    return datetime.now(timezone.utc)
 
 
 class ChatRequest(BaseModel):
     """Request model for chat endpoint."""
     
-    message: str = Field(
+    # strip_whitespace runs in pydantic-core before min_length, so a
+    # whitespace-only message still fails validation - same behavior as
+    # the old Python field_validator without the per-request callback
+    message: Annotated[
+        str,
+        StringConstraints(strip_whitespace=True, min_length=1, max_length=2000)
+    ] = Field(
         ...,
-        min_length=1,
-        max_length=2000,
         description="User message"
     )
-    
-    @field_validator('message')
-    @classmethod
-    def validate_message_not_empty(cls, v: str) -> str:
-        """Validate that message is not just whitespace."""
-        if not v or not v.strip():
-            raise ValueError("Message cannot be empty or contain only whitespace")
-        return v.strip()
     session_id: Optional[str] = Field(
         None,
         description="Session ID for conversation tracking. If not provided, a new session will be created."
@@ -41,7 +41,7 @@ class ChatResponse(BaseModel):
     
     response: str = Field(..., description="AI assistant response")
     session_id: str = Field(..., description="Session ID for this conversation")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Response timestamp")
+    timestamp: datetime = Field(default_factory=_utc_now, description="Response timestamp")
     
     class Config:
         json_schema_extra = {
@@ -7,27 +7,38 @@ import re
 from typing import List, Dict, Any
 from pathlib import Path
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import math
 
+import numpy as np
+
+# One C-level scan: the character class does the splitting and {3,}
+# folds in the old "len(t) > 2" filter
+_TOKEN_RE = re.compile(r'[a-z0-9]{3,}')
+
 
 class SimpleEmbedder:
     """
     Simple text embedder using TF-IDF approach.
     Good enough for demo purposes without requiring heavy ML libraries.
+    Vectors are NumPy float32 arrays so dot products run in BLAS, not
+    Python bytecode.
     """
 
     def __init__(self):
         self.idf_scores = {}
         self.documents = []
         self.vocab = set()
+        # Frozen after fit(): word -> column index, and the aligned IDF row
+        self.vocab_index: Dict[str, int] = {}
+        self.idf = np.zeros(0, dtype=np.float32)
+        # Memoized query embeddings - users and the agent retry the same
+        # queries, and the vectors are tiny
+        self._embed_cache: Dict[str, tuple] = {}
 
     def _tokenize(self, text: str) -> List[str]:
-        """Tokenize text into words."""
-        text = text.lower()
-        # Remove special characters but keep spaces
-        text = re.sub(r'[^a-z0-9\s]', ' ', text)
-        tokens = text.split()
-        return [t for t in tokens if len(t) > 2]  # Filter short words
+        """Tokenize text into lowercase words of 3+ characters."""
+        return _TOKEN_RE.findall(text.lower())
 
     def _compute_tf(self, tokens: List[str]) -> Dict[str, float]:
         """Compute term frequency."""
@@ -35,61 +46,130 @@ class SimpleEmbedder:
         total = len(tokens)
         return {word: count / total for word, count in counter.items()}
 
-    def fit(self, documents: List[str]):
-        """Fit the embedder on a corpus of documents."""
+    def fit(self, documents: List[str], tokenized_docs: List[List[str]] = None):
+        """
+        Fit the embedder on a corpus of documents.
+
+        Pass tokenized_docs when the caller has already tokenized the
+        corpus, to avoid scanning every document a second time.
+        """
         self.documents = documents
-        
-        # Tokenize all documents
-        tokenized_docs = [self._tokenize(doc) for doc in documents]
-        
+
+        # Tokenize all documents (unless pre-tokenized by the caller)
+        if tokenized_docs is None:
+            tokenized_docs = [self._tokenize(doc) for doc in documents]
+
         # Build vocabulary
         for tokens in tokenized_docs:
             self.vocab.update(tokens)
-        
+
         # Compute IDF scores
         doc_count = len(documents)
         word_doc_count = Counter()
-        
+
         for tokens in tokenized_docs:
             unique_tokens = set(tokens)
             for token in unique_tokens:
                 word_doc_count[token] += 1
-        
+
         # IDF = log(total_documents / documents_containing_word)
         for word, count in word_doc_count.items():
             self.idf_scores[word] = math.log(doc_count / count)
 
-    def embed(self, text: str) -> List[float]:
+        # Freeze the vocab ordering and align an IDF array to it, so
+        # embed() can index columns instead of iterating sorted(vocab)
+        vocab_list = sorted(self.vocab)
+        self.vocab_index = {word: i for i, word in enumerate(vocab_list)}
+        self.idf = np.asarray(
+            [self.idf_scores.get(word, 0.0) for word in vocab_list],
+            dtype=np.float32
+        )
+
+    def embed(self, text: str) -> np.ndarray:
         """
         Create a simple TF-IDF vector for the text.
-        Returns a fixed-size vector based on vocabulary.
+        Returns a fixed-size float32 vector aligned to the vocabulary.
         """
-        tokens = self._tokenize(text)
-        tf_scores = self._compute_tf(tokens)
-        
-        # Create vector: use sorted vocab for consistent ordering
-        vocab_list = sorted(self.vocab)
-        vector = []
-        
-        for word in vocab_list:
-            tf = tf_scores.get(word, 0.0)
-            idf = self.idf_scores.get(word, 0.0)
-            tfidf = tf * idf
-            vector.append(tfidf)
-        
+        return self.embed_tokens(self._tokenize(text))
+
+    def embed_tokens(self, tokens: List[str]) -> np.ndarray:
+        """Embed already-tokenized text (skips re-tokenization)."""
+        vector = np.zeros(len(self.vocab_index), dtype=np.float32)
+        if not tokens:
+            return vector
+
+        # Only query tokens touch the vector; everything else stays zero
+        total = len(tokens)
+        vocab_index = self.vocab_index
+        for token, count in Counter(tokens).items():
+            idx = vocab_index.get(token)
+            if idx is not None:
+                vector[idx] = count / total
+
+        vector *= self.idf
+
         # Normalize vector
-        magnitude = math.sqrt(sum(v ** 2 for v in vector))
+        magnitude = np.linalg.norm(vector)
         if magnitude > 0:
-            vector = [v / magnitude for v in vector]
-        
+            vector /= magnitude
+
         return vector
 
-    def similarity(self, vec1: List[float], vec2: List[float]) -> float:
+    def embed_sparse(self, text: str):
+        """
+        Create a sparse TF-IDF vector as an (indices, data) pair.
+
+        Only the nonzero entries are materialized, so downstream scoring
+        costs O(query tokens) instead of O(vocab). Unknown tokens are
+        dropped. Both arrays are empty when nothing matches the vocab.
+        Results are memoized per normalized query string.
+        """
+        key = text.strip().lower()
+        cached = self._embed_cache.get(key)
+        if cached is not None:
+            return cached
+
+        tokens = self._tokenize(text)
+        if not tokens:
+            result = (np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.float32))
+            self._cache_embedding(key, result)
+            return result
+
+        total = len(tokens)
+        vocab_index = self.vocab_index
+        indices = []
+        data = []
+        for token, count in Counter(tokens).items():
+            idx = vocab_index.get(token)
+            if idx is not None:
+                indices.append(idx)
+                data.append(count / total)
+
+        indices = np.asarray(indices, dtype=np.intp)
+        data = np.asarray(data, dtype=np.float32)
+        data *= self.idf[indices]
+
+        magnitude = np.linalg.norm(data)
+        if magnitude > 0:
+            data /= magnitude
+
+        result = (indices, data)
+        self._cache_embedding(key, result)
+        return result
+
+    def _cache_embedding(self, key: str, result: tuple):
+        """Store a memoized embedding, evicting oldest entries when full."""
+        if len(self._embed_cache) >= 1024:
+            # dicts preserve insertion order; drop the oldest entry
+            self._embed_cache.pop(next(iter(self._embed_cache)))
+        self._embed_cache[key] = result
+
+    def similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
         """Compute cosine similarity between two vectors."""
         if len(vec1) != len(vec2):
             return 0.0
-        
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
+
+        dot_product = float(np.dot(vec1, vec2))
         return max(0.0, min(1.0, dot_product))  # Clamp to [0, 1]
 
 
@@ -109,13 +189,21 @@ class ProductVectorStore:
     def load_products(self, products_file: str):
         """Load products from JSON file."""
         file_path = Path(products_file)
-        
+
         if not file_path.exists():
             raise FileNotFoundError(f"Products file not found: {products_file}")
-        
+
         with open(file_path, 'r', encoding='utf-8') as f:
             self.products = json.load(f)
-        
+
+        # Fitting and embedding the catalog is pure function of the JSON
+        # file, so cache the result on disk and skip the work on boot
+        # (and on every dev-server reload) until the JSON changes
+        cache_path = file_path.parent / "vector_store" / "products.npz"
+        if self._restore_from_cache(cache_path, file_path.stat().st_mtime):
+            print(f"✅ Restored {len(self.products)} products from cached vector store")
+            return
+
         # Create searchable text for each product
         product_texts = []
         for product in self.products:
@@ -132,12 +220,58 @@ class ProductVectorStore:
             text = ' '.join(text_parts)
             product_texts.append(text)
         
-        # Fit embedder and create vectors
-        self.embedder.fit(product_texts)
-        self.product_vectors = [self.embedder.embed(text) for text in product_texts]
-        
+        # Tokenize each product once, shared between fit and embedding,
+        # then stack vectors into one (N_products, vocab) matrix.
+        # Embedding fans out across threads - NumPy releases the GIL in
+        # the array ops, so a large catalog fits on all cores. This runs
+        # only on a cache miss; warm boots restore the npz instead.
+        tokenized = [self.embedder._tokenize(text) for text in product_texts]
+        self.embedder.fit(product_texts, tokenized_docs=tokenized)
+        with ThreadPoolExecutor() as pool:
+            self.product_vectors = np.vstack(
+                list(pool.map(self.embedder.embed_tokens, tokenized))
+            )
+
+        self._save_to_cache(cache_path, file_path.stat().st_mtime)
+
         print(f"✅ Loaded {len(self.products)} products into vector store")
 
+    def _restore_from_cache(self, cache_path: Path, source_mtime: float) -> bool:
+        """Restore fitted embedder state from an npz cache if still fresh."""
+        if not cache_path.exists():
+            return False
+        try:
+            cached = np.load(cache_path, allow_pickle=False)
+            if float(cached["mtime"]) != source_mtime:
+                return False  # products JSON changed since the cache was built
+
+            vocab = [str(word) for word in cached["vocab"]]
+            self.embedder.vocab = set(vocab)
+            self.embedder.vocab_index = {word: i for i, word in enumerate(vocab)}
+            self.embedder.idf = cached["idf"].astype(np.float32)
+            self.embedder.idf_scores = dict(zip(vocab, self.embedder.idf.tolist()))
+            self.product_vectors = cached["matrix"].astype(np.float32)
+            return True
+        except Exception as e:
+            # A corrupt/stale cache just means a regular fit
+            print(f"⚠️  Could not restore vector store cache: {e}")
+            return False
+
+    def _save_to_cache(self, cache_path: Path, source_mtime: float):
+        """Persist fitted embedder state so the next boot can skip fit()."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            vocab = sorted(self.embedder.vocab_index, key=self.embedder.vocab_index.get)
+            np.savez(
+                cache_path,
+                mtime=np.float64(source_mtime),
+                vocab=np.array(vocab),
+                idf=self.embedder.idf,
+                matrix=self.product_vectors,
+            )
+        except Exception as e:
+            print(f"⚠️  Could not write vector store cache: {e}")
+
     def search(self, query: str, top_k: int = 3) -> List[Dict[str, Any]]:
         """
         Search for products matching the query.
@@ -152,25 +286,26 @@ class ProductVectorStore:
         if not self.products:
             return []
         
-        # Create query vector
-        query_vector = self.embedder.embed(query)
-        
-        # Compute similarities
-        similarities = []
-        for idx, product_vector in enumerate(self.product_vectors):
-            similarity = self.embedder.similarity(query_vector, product_vector)
-            similarities.append((idx, similarity))
-        
-        # Sort by similarity (descending)
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        
-        # Get top K results
+        # Sparse query vector: only the columns the query actually touches
+        indices, data = self.embedder.embed_sparse(query)
+        if indices.size:
+            # Multiply just those columns - work scales with query length,
+            # not vocabulary size
+            scores = np.clip(self.product_vectors[:, indices] @ data, 0.0, 1.0)
+        else:
+            scores = np.zeros(len(self.products), dtype=np.float32)
+
+        # Select top K without sorting all N, then order just those K
+        top_k = min(top_k, len(self.products))
+        top_idx = np.argpartition(scores, -top_k)[-top_k:]
+        top_idx = top_idx[np.argsort(scores[top_idx])[::-1]]
+
         results = []
-        for idx, score in similarities[:top_k]:
+        for idx in top_idx:
             product = self.products[idx].copy()
-            product['similarity_score'] = round(score, 3)
+            product['similarity_score'] = round(float(scores[idx]), 3)
             results.append(product)
-        
+
         return results
 
     def get_all_products(self) -> List[Dict[str, Any]]:
@@ -4,8 +4,87 @@ This module converts natural language queries into safe SQL statements
 for querying the outlets database.
 """
 import re
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
 
+# Every dispatch pattern requires at least one of these literals, so a
+# query containing none of them can skip pattern dispatch entirely.
+# Compiled into one alternation: a single linear scan over the query
+# instead of one substring pass per keyword.
+_TRIGGER_KEYWORDS = ('outlet', 'wifi', 'drive', 'hour', 'open', 'count', 'many')
+_TRIGGER_RE = re.compile('|'.join(_TRIGGER_KEYWORDS))
+
+# Shared column list for the five outlet-listing handlers: one literal
+# to keep in sync, and identical SELECT prefixes mean SQLite's
+# prepared-statement cache sees the same text more often
+_OUTLET_SELECT = """
+            SELECT outlet_id, outlet_name, address, city, state, phone,
+                   operating_hours, has_drive_thru, has_wifi
+            FROM outlets """
+
+# One SQL string per query type, assembled once at import. Handlers
+# returning the same object every call keeps sqlite3's per-connection
+# statement cache (and its text lookup) on the fast path, instead of
+# re-rendering an f-string template per request.
+_SQL_BY_LOCATION = f"""{_OUTLET_SELECT}
+            WHERE city_lower = LOWER(?) OR state_lower = LOWER(?)
+            ORDER BY outlet_name
+        """
+
+_SQL_DRIVE_THRU = f"""{_OUTLET_SELECT}
+            WHERE has_drive_thru = TRUE
+            ORDER BY city, outlet_name
+        """
+
+_SQL_WIFI = f"""{_OUTLET_SELECT}
+            WHERE has_wifi = TRUE
+            ORDER BY city, outlet_name
+        """
+
+_SQL_LOCATION_DRIVE_THRU = f"""{_OUTLET_SELECT}
+            WHERE (city_lower = LOWER(?) OR state_lower = LOWER(?))
+              AND has_drive_thru = TRUE
+            ORDER BY outlet_name
+        """
+
+_SQL_LOCATION_WIFI = f"""{_OUTLET_SELECT}
+            WHERE (city_lower = LOWER(?) OR state_lower = LOWER(?))
+              AND has_wifi = TRUE
+            ORDER BY outlet_name
+        """
+
+_SQL_OPERATING_HOURS = """
+            SELECT outlet_id, outlet_name, address, city, operating_hours
+            FROM outlets
+            WHERE LOWER(outlet_name) LIKE LOWER(?)
+               OR LOWER(address) LIKE LOWER(?)
+            ORDER BY outlet_name
+            LIMIT 5
+        """
+
+_SQL_COUNT_BY_LOCATION = """
+            SELECT COUNT(*) as count
+            FROM outlets
+            WHERE city_lower = LOWER(?) OR state_lower = LOWER(?)
+        """
+
+_SQL_ALL_OUTLETS = f"""{_OUTLET_SELECT}
+            ORDER BY state, city, outlet_name
+        """
+
+# Shared failure-path SQL: validation rejects return these constants
+# instead of building a fresh string per rejected query
+_SQL_NO_RESULTS = "SELECT * FROM outlets WHERE 1=0"
+_SQL_ZERO_COUNT = "SELECT 0 as count"
+
+# The parameter-less query types always produce the same metadata, so
+# the handlers share one read-only dict each instead of allocating a
+# fresh one per call. generate_sql() copies before handing to callers.
+_META_DRIVE_THRU = MappingProxyType({"query_type": "drive_thru", "valid": True})
+_META_WIFI = MappingProxyType({"query_type": "wifi", "valid": True})
+_META_ALL = MappingProxyType({"query_type": "all", "valid": True})
+
 
 class Text2SQLGenerator:
     """
@@ -14,59 +93,35 @@ class Text2SQLGenerator:
     """
     
     # SQL injection prevention - whitelist of allowed values
-    ALLOWED_CITIES = {
-        'kuala lumpur', 'kl', 'petaling jaya', 'pj', 'subang jaya', 
+    ALLOWED_CITIES = frozenset({
+        'kuala lumpur', 'kl', 'petaling jaya', 'pj', 'subang jaya',
         'shah alam', 'putrajaya', 'cyberjaya', 'george town', 'penang',
         'johor bahru', 'jb'
-    }
-    
-    ALLOWED_STATES = {
+    })
+
+    ALLOWED_STATES = frozenset({
         'selangor', 'kuala lumpur', 'kl', 'putrajaya', 'penang', 'johor'
-    }
-    
+    })
+
+    # Merged whitelist: validation needs one membership test, not two
+    _ALLOWED_LOCATIONS = ALLOWED_CITIES | ALLOWED_STATES
+
+
     CITY_ALIASES = {
         'kl': 'Kuala Lumpur',
         'pj': 'Petaling Jaya',
         'jb': 'Johor Bahru'
     }
-    
-    def __init__(self):
-        """Initialize the Text2SQL generator."""
-        self.query_patterns = [
-            # Combined queries (must come BEFORE simple location queries)
-            (r'outlets?\s+in\s+([a-z0-9\s\'\-;]+?)\s+with\s+(?:free\s+)?wifi', self._query_location_with_wifi),
-            (r'outlets?\s+in\s+([a-z0-9\s\'\-;]+?)\s+with\s+drive[\s-]?(?:thru|through)', self._query_location_with_drive_thru),
-            (r'outlets?\s+in\s+([a-z0-9\s\'\-;]+?)\s+(?:that\s+)?(?:have|has)\s+wifi', self._query_location_with_wifi),
-            
-            # Location-based queries (now allows more chars to catch invalid input)
-            (r'outlets?\s+in\s+([a-z0-9\s\'\-;]+?)(?=\s+(?:that|with|having|who|which)\b|\s*$)', self._query_by_location),
-            (r'(?:find|show|list|get)\s+(?:me\s+)?(?:all\s+)?outlets?\s+in\s+([a-z0-9\s\'\-;]+?)(?=\s+(?:that|with|having|who|which)\b|\s*$)', self._query_by_location),
-            (r'where\s+(?:are|is)\s+(?:the\s+)?outlets?\s+in\s+([a-z0-9\s\'\-;]+?)(?=\s+(?:that|with|having|who|which)\b|\s*$)', self._query_by_location),
-            
-            # Feature-based queries
-            (r'(?:which|what)\s+outlets?\s+(?:have|has)\s+drive[\s-]?(?:thru|through)', self._query_with_drive_thru),
-            (r'outlets?\s+with\s+drive[\s-]?(?:thru|through)', self._query_with_drive_thru),
-            (r'(?:find|show|list|get)\s+(?:me\s+)?(?:all\s+)?outlets?\s+with\s+drive[\s-]?(?:thru|through)', self._query_with_drive_thru),
-            (r'drive[\s-]?(?:thru|through)\s+outlets?', self._query_with_drive_thru),
-            (r'(?:which|what)\s+outlets?\s+(?:have|has)\s+wifi', self._query_with_wifi),
-            (r'outlets?\s+with\s+(?:free\s+)?wifi', self._query_with_wifi),
-            (r'(?:find|show|list|get)\s+(?:me\s+)?(?:all\s+)?outlets?\s+with\s+(?:free\s+)?wifi', self._query_with_wifi),
-            (r'outlets?\s+(?:that\s+)?(?:have|has)\s+wifi', self._query_with_wifi),
-            (r'wifi\s+outlets?', self._query_with_wifi),
-            
-            # Operating hours
-            (r'(?:opening|operating)\s+hours?\s+(?:for|of)\s+(.+?)(?:\s+outlet)?$', self._query_operating_hours),
-            (r'when\s+(?:does|is)\s+(.+?)\s+(?:outlet\s+)?open', self._query_operating_hours),
-            
-            # Count queries
-            (r'how\s+many\s+outlets?\s+(?:are\s+)?(?:there\s+)?in\s+([a-z\s]+)', self._query_count_by_location),
-            (r'count\s+outlets?\s+in\s+([a-z\s]+)', self._query_count_by_location),
-            
-            # All outlets
-            (r'^(?:show|list|get)\s+(?:me\s+)?(?:all\s+)?outlets?$', self._query_all_outlets),
-            (r'^all\s+outlets?$', self._query_all_outlets),
-        ]
-    
+
+    # Pre-lowered lookup straight to the canonical display form: every
+    # known location (and alias) resolves with one dict hit instead of a
+    # per-call str.title() walk
+    _CANONICAL_LOCATIONS = {
+        **{name: name.title() for name in _ALLOWED_LOCATIONS},
+        **CITY_ALIASES,
+    }
+
+
     def generate_sql(self, natural_query: str) -> Tuple[str, List[any], Dict[str, any]]:
         """
         Convert natural language query to SQL.
@@ -82,36 +137,71 @@ class Text2SQLGenerator:
         """
         # Normalize query
         query = natural_query.lower().strip()
-        
-        # Try each pattern
-        for pattern, handler in self.query_patterns:
-            match = re.search(pattern, query)
-            if match:
-                sql, params, metadata = handler(match, query)
-                # Ensure valid key exists (only if not explicitly set to False)
-                if "valid" not in metadata:
-                    metadata["valid"] = True
-                return sql, params, metadata
-        
+
+        # Generation is pure given the normalized query, and chat traffic
+        # repeats the same handful of phrasings constantly - memoize on
+        # the singleton. Hand back fresh copies so callers can't mutate
+        # the cached result.
+        sql, params, metadata = self._generate_cached(query)
+        return sql, list(params), dict(metadata)
+
+    @lru_cache(maxsize=512)
+    def _generate_cached(self, query: str) -> Tuple[str, tuple, Dict[str, any]]:
+        """Dispatch a normalized query to its pattern handler (memoized)."""
+        # Chit-chat and other non-outlet input ("hi", "thanks") contains
+        # none of the trigger literals - fall through to the default
+        # after one fused keyword scan
+        if _TRIGGER_RE.search(query) is None:
+            sql, params, metadata = self._query_all_outlets(None, query)
+            return sql, tuple(params), metadata
+
+        # One fused-alternation scan decides whether anything matches and
+        # names a candidate pattern. The alternation picks the leftmost
+        # match in the string, so a higher-priority pattern matching
+        # later could be shadowed; verify the few patterns above the
+        # candidate (needle-prefiltered) to keep priority order exact.
+        mega_match = self._MEGA.search(query)
+        if mega_match:
+            idx = int(mega_match.lastgroup[1:])
+            match = None
+            for pattern, needle, hd in self._COMPILED_PATTERNS[:idx]:
+                if needle in query:
+                    match = pattern.search(query)
+                    if match:
+                        handler = hd
+                        break
+            if match is None:
+                pattern, _, handler = self._COMPILED_PATTERNS[idx]
+                match = pattern.search(query)
+
+            sql, params, metadata = handler(self, match, query)
+            # Ensure valid key exists (only if not explicitly set to False)
+            if "valid" not in metadata:
+                metadata["valid"] = True
+            return sql, tuple(params), metadata
+
         # Default: return all outlets (no pattern matched)
-        return self._query_all_outlets(None, query)
+        sql, params, metadata = self._query_all_outlets(None, query)
+        return sql, tuple(params), metadata
     
     def _normalize_location(self, location: str) -> str:
         """Normalize location name (handle aliases, clean whitespace)."""
         location = location.strip().lower()
-        
-        # Check aliases
-        if location in self.CITY_ALIASES:
-            return self.CITY_ALIASES[location]
-        
-        # Title case for display
+
+        canonical = self._CANONICAL_LOCATIONS.get(location)
+        if canonical is not None:
+            return canonical
+
+        # Unknown input (will fail validation) - title case for display
         return location.title()
     
     def _validate_location(self, location: str) -> bool:
-        """Validate that location is in allowed list."""
-        location_lower = location.lower().strip()
-        return (location_lower in self.ALLOWED_CITIES or 
-                location_lower in self.ALLOWED_STATES)
+        """Validate that location is in allowed list.
+
+        Callers pass _normalize_location output, which is already
+        stripped, so only the case fold is needed here.
+        """
+        return location.lower() in self._ALLOWED_LOCATIONS
     
     def _query_by_location(self, match: re.Match, query: str) -> Tuple[str, List, Dict]:
         """Generate SQL for location-based queries."""
@@ -120,21 +210,13 @@ class Text2SQLGenerator:
         # Validate to prevent injection
         if not self._validate_location(location):
             # Return empty result for invalid locations
-            return "SELECT * FROM outlets WHERE 1=0", [], {
+            return _SQL_NO_RESULTS, [], {
                 "query_type": "location",
                 "location": location,
                 "valid": False
             }
         
-        sql = """
-            SELECT outlet_id, outlet_name, address, city, state, phone, 
-                   operating_hours, has_drive_thru, has_wifi
-            FROM outlets 
-            WHERE LOWER(city) = LOWER(?) OR LOWER(state) = LOWER(?)
-            ORDER BY outlet_name
-        """
-        
-        return sql, [location, location], {
+        return _SQL_BY_LOCATION, [location, location], {
             "query_type": "location",
             "location": location,
             "valid": True
@@ -142,49 +224,24 @@ class Text2SQLGenerator:
     
     def _query_with_drive_thru(self, match: re.Match, query: str) -> Tuple[str, List, Dict]:
         """Generate SQL for drive-through queries."""
-        sql = """
-            SELECT outlet_id, outlet_name, address, city, state, phone, 
-                   operating_hours, has_drive_thru, has_wifi
-            FROM outlets 
-            WHERE has_drive_thru = TRUE
-            ORDER BY city, outlet_name
-        """
-        
-        return sql, [], {"query_type": "drive_thru"}
+        return _SQL_DRIVE_THRU, [], _META_DRIVE_THRU
     
     def _query_with_wifi(self, match: re.Match, query: str) -> Tuple[str, List, Dict]:
         """Generate SQL for WiFi queries."""
-        sql = """
-            SELECT outlet_id, outlet_name, address, city, state, phone, 
-                   operating_hours, has_drive_thru, has_wifi
-            FROM outlets 
-            WHERE has_wifi = TRUE
-            ORDER BY city, outlet_name
-        """
-        
-        return sql, [], {"query_type": "wifi"}
+        return _SQL_WIFI, [], _META_WIFI
     
     def _query_location_with_drive_thru(self, match: re.Match, query: str) -> Tuple[str, List, Dict]:
         """Generate SQL for location + drive-through queries."""
         location = self._normalize_location(match.group(1))
         
         if not self._validate_location(location):
-            return "SELECT * FROM outlets WHERE 1=0", [], {
+            return _SQL_NO_RESULTS, [], {
                 "query_type": "location_drive_thru",
                 "location": location,
                 "valid": False
             }
         
-        sql = """
-            SELECT outlet_id, outlet_name, address, city, state, phone, 
-                   operating_hours, has_drive_thru, has_wifi
-            FROM outlets 
-            WHERE (LOWER(city) = LOWER(?) OR LOWER(state) = LOWER(?))
-              AND has_drive_thru = TRUE
-            ORDER BY outlet_name
-        """
-        
-        return sql, [location, location], {
+        return _SQL_LOCATION_DRIVE_THRU, [location, location], {
             "query_type": "location_drive_thru",
             "location": location,
             "valid": True
@@ -195,22 +252,13 @@ class Text2SQLGenerator:
         location = self._normalize_location(match.group(1))
         
         if not self._validate_location(location):
-            return "SELECT * FROM outlets WHERE 1=0", [], {
+            return _SQL_NO_RESULTS, [], {
                 "query_type": "location_wifi",
                 "location": location,
                 "valid": False
             }
         
-        sql = """
-            SELECT outlet_id, outlet_name, address, city, state, phone, 
-                   operating_hours, has_drive_thru, has_wifi
-            FROM outlets 
-            WHERE (LOWER(city) = LOWER(?) OR LOWER(state) = LOWER(?))
-              AND has_wifi = TRUE
-            ORDER BY outlet_name
-        """
-        
-        return sql, [location, location], {
+        return _SQL_LOCATION_WIFI, [location, location], {
             "query_type": "location_wifi",
             "location": location,
             "valid": True
@@ -220,18 +268,9 @@ class Text2SQLGenerator:
         """Generate SQL for operating hours queries."""
         outlet_name = match.group(1).strip()
         
-        sql = """
-            SELECT outlet_id, outlet_name, address, city, operating_hours
-            FROM outlets 
-            WHERE LOWER(outlet_name) LIKE LOWER(?)
-               OR LOWER(address) LIKE LOWER(?)
-            ORDER BY outlet_name
-            LIMIT 5
-        """
-        
         search_pattern = f"%{outlet_name}%"
         
-        return sql, [search_pattern, search_pattern], {
+        return _SQL_OPERATING_HOURS, [search_pattern, search_pattern], {
             "query_type": "operating_hours",
             "outlet_name": outlet_name
         }
@@ -241,19 +280,13 @@ class Text2SQLGenerator:
         location = self._normalize_location(match.group(1))
         
         if not self._validate_location(location):
-            return "SELECT 0 as count", [], {
+            return _SQL_ZERO_COUNT, [], {
                 "query_type": "count",
                 "location": location,
                 "valid": False
             }
         
-        sql = """
-            SELECT COUNT(*) as count
-            FROM outlets 
-            WHERE LOWER(city) = LOWER(?) OR LOWER(state) = LOWER(?)
-        """
-        
-        return sql, [location, location], {
+        return _SQL_COUNT_BY_LOCATION, [location, location], {
             "query_type": "count",
             "location": location,
             "valid": True
@@ -261,24 +294,65 @@ class Text2SQLGenerator:
     
     def _query_all_outlets(self, match: Optional[re.Match], query: str) -> Tuple[str, List, Dict]:
         """Generate SQL for listing all outlets."""
-        sql = """
-            SELECT outlet_id, outlet_name, address, city, state, phone, 
-                   operating_hours, has_drive_thru, has_wifi
-            FROM outlets 
-            ORDER BY state, city, outlet_name
-        """
-        
-        return sql, [], {"query_type": "all", "valid": True}
+        return _SQL_ALL_OUTLETS, [], _META_ALL
+
+    # Dispatch table built once at class-definition time. Handlers are
+    # the plain functions above and receive self explicitly. Each entry
+    # carries a literal substring its regex requires, checked with the
+    # C-level str.__contains__ before the regex runs.
+    _PATTERN_TABLE = [
+            # Combined queries (must come BEFORE simple location queries)
+            (r'outlets?\s+in\s+([a-z0-9\s\'\-;]+?)\s+with\s+(?:free\s+)?wifi', 'wifi', _query_location_with_wifi),
+            (r'outlets?\s+in\s+([a-z0-9\s\'\-;]+?)\s+with\s+drive[\s-]?(?:thru|through)', 'drive', _query_location_with_drive_thru),
+            (r'outlets?\s+in\s+([a-z0-9\s\'\-;]+?)\s+(?:that\s+)?(?:have|has)\s+wifi', 'wifi', _query_location_with_wifi),
+
+            # Location-based queries (now allows more chars to catch invalid input)
+            (r'outlets?\s+in\s+([a-z0-9\s\'\-;]+?)(?=\s+(?:that|with|having|who|which)\b|\s*$)', 'in', _query_by_location),
+            (r'(?:find|show|list|get)\s+(?:me\s+)?(?:all\s+)?outlets?\s+in\s+([a-z0-9\s\'\-;]+?)(?=\s+(?:that|with|having|who|which)\b|\s*$)', 'in', _query_by_location),
+            (r'where\s+(?:are|is)\s+(?:the\s+)?outlets?\s+in\s+([a-z0-9\s\'\-;]+?)(?=\s+(?:that|with|having|who|which)\b|\s*$)', 'in', _query_by_location),
+
+            # Feature-based queries
+            (r'(?:which|what)\s+outlets?\s+(?:have|has)\s+drive[\s-]?(?:thru|through)', 'drive', _query_with_drive_thru),
+            (r'outlets?\s+with\s+drive[\s-]?(?:thru|through)', 'drive', _query_with_drive_thru),
+            (r'(?:find|show|list|get)\s+(?:me\s+)?(?:all\s+)?outlets?\s+with\s+drive[\s-]?(?:thru|through)', 'drive', _query_with_drive_thru),
+            (r'drive[\s-]?(?:thru|through)\s+outlets?', 'drive', _query_with_drive_thru),
+            (r'(?:which|what)\s+outlets?\s+(?:have|has)\s+wifi', 'wifi', _query_with_wifi),
+            (r'outlets?\s+with\s+(?:free\s+)?wifi', 'wifi', _query_with_wifi),
+            (r'(?:find|show|list|get)\s+(?:me\s+)?(?:all\s+)?outlets?\s+with\s+(?:free\s+)?wifi', 'wifi', _query_with_wifi),
+            (r'outlets?\s+(?:that\s+)?(?:have|has)\s+wifi', 'wifi', _query_with_wifi),
+            (r'wifi\s+outlets?', 'wifi', _query_with_wifi),
+
+            # Operating hours
+            (r'(?:opening|operating)\s+hours?\s+(?:for|of)\s+(.+?)(?:\s+outlet)?$', 'hour', _query_operating_hours),
+            (r'when\s+(?:does|is)\s+(.+?)\s+(?:outlet\s+)?open', 'open', _query_operating_hours),
+
+            # Count queries
+            (r'how\s+many\s+outlets?\s+(?:are\s+)?(?:there\s+)?in\s+([a-z\s]+)', 'many', _query_count_by_location),
+            (r'count\s+outlets?\s+in\s+([a-z\s]+)', 'count', _query_count_by_location),
+
+            # All outlets
+            (r'^(?:show|list|get)\s+(?:me\s+)?(?:all\s+)?outlets?$', 'outlet', _query_all_outlets),
+            (r'^all\s+outlets?$', 'outlet', _query_all_outlets),
+    ]
+
+    _COMPILED_PATTERNS = [(re.compile(p), n, h) for p, n, h in _PATTERN_TABLE]
+
+    # All patterns fused into one alternation: the engine scans the query
+    # once and m.lastgroup names the alternative that matched, instead of
+    # up to ~20 separate search passes
+    _MEGA = re.compile(
+        "|".join(f"(?P<k{i}>{p})" for i, (p, _, _) in enumerate(_PATTERN_TABLE))
+    )
+
 
+# Global instance, built eagerly at import: construction is trivial
+# (patterns compile at class definition) and callers skip the
+# global-guard branch on every lookup
+_generator = Text2SQLGenerator()
 
-# Global instance
-_generator = None
 
 def get_text2sql_generator() -> Text2SQLGenerator:
     """Get the singleton Text2SQL generator instance."""
-    global _generator
-    if _generator is None:
-        _generator = Text2SQLGenerator()
     return _generator
 
 
@@ -1,8 +1,71 @@
 """Calculator tool for mathematical expressions."""
+import ast
+import operator
+from functools import lru_cache
 from typing import Optional
+
 from langchain.tools import BaseTool
 from pydantic import Field
-import re
+
+# Whitelist gate: translate() deletes every allowed character in one
+# C-level pass, so any surviving character is an invalid one - no regex
+# engine involved
+_ALLOWED_CHARS = "0123456789 \t+-*/.()"
+_DELETE_ALLOWED = str.maketrans("", "", _ALLOWED_CHARS)
+
+# Arithmetic-only AST evaluation: cheaper than eval() (no bytecode
+# compile per call) and structurally incapable of running anything but
+# the operators below
+_ALLOWED_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Pow: operator.pow,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+
+@lru_cache(maxsize=256)
+def _parse(expression: str) -> ast.expr:
+    """Parse an expression once; repeat expressions skip the parser."""
+    return ast.parse(expression, mode="eval").body
+
+
+def _balanced_parens(expression: str) -> bool:
+    """Check parenthesis balance in a single pass.
+
+    One traversal instead of two str.count() scans, and a running
+    balance also rejects closing-before-opening cases like ')(' that
+    equal counts would let through.
+    """
+    balance = 0
+    for char in expression:
+        if char == '(':
+            balance += 1
+        elif char == ')':
+            balance -= 1
+            if balance < 0:
+                return False
+    return balance == 0
+
+
+def _eval_node(node: ast.expr):
+    """Recursively evaluate an arithmetic AST node."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    if isinstance(node, ast.BinOp):
+        op = _ALLOWED_OPS.get(type(node.op))
+        if op is not None:
+            return op(_eval_node(node.left), _eval_node(node.right))
+    elif isinstance(node, ast.UnaryOp):
+        op = _ALLOWED_OPS.get(type(node.op))
+        if op is not None:
+            return op(_eval_node(node.operand))
+    # Anything else (tuples, names, calls, ...) is not arithmetic
+    raise SyntaxError(f"unsupported expression: {ast.dump(node)[:50]}")
 
 
 class CalculatorTool(BaseTool):
@@ -37,16 +100,16 @@ class CalculatorTool(BaseTool):
                 return "Error: Please provide a mathematical expression to calculate. For example: 'Calculate 5 + 3'"
             
             # Security: Only allow numbers, operators, spaces, and parentheses
-            if not re.match(r'^[\d\s+\-*/.()]+$', query):
+            if query.translate(_DELETE_ALLOWED):
                 return "Error: Invalid characters in expression. Only numbers and operators (+, -, *, /, **) are allowed."
             
             # Check for potential issues
-            if query.count('(') != query.count(')'):
+            if not _balanced_parens(query):
                 return "Error: Mismatched parentheses in expression."
             
-            # Evaluate the expression safely
-            # Using eval with restricted globals/locals for safety
-            result = eval(query, {"__builtins__": {}}, {})
+            # Evaluate via the arithmetic AST walker - no compile() or
+            # eval() machinery, and parse trees are memoized per expression
+            result = _eval_node(_parse(query))
             
             # Check for infinity or NaN
             if not isinstance(result, (int, float)):
@@ -77,3 +140,7 @@ class CalculatorTool(BaseTool):
         """Async version of the tool (calls sync version)."""
         return self._run(query)
 
+
+# Shared instance - the tool is stateless, so agents reuse it
+calculator_tool = CalculatorTool()
+
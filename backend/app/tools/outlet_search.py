@@ -6,6 +6,9 @@ from pydantic import BaseModel, Field
 from app.text2sql.query_generator import get_text2sql_generator
 from app.db.database import db
 
+# Bound once at import - the generator is a stateless singleton
+_text2sql = get_text2sql_generator()
+
 
 class OutletSearchInput(BaseModel):
     """Input for OutletSearchTool."""
@@ -24,6 +27,12 @@ class OutletSearchTool(BaseTool):
     )
     args_schema: Type[BaseModel] = OutletSearchInput
 
+    # Row templates built once; sqlite3.Row is a mapping by column name,
+    # so format_map(row) substitutes in C with no per-field Python code.
+    # Optional fields (phone/hours/features) stay conditional in the loop.
+    _HOURS_ROW_TMPL = "\n**{outlet_name}** ({city})\nHours: {operating_hours}"
+    _OUTLET_ROW_TMPL = "**{outlet_name}**\n   Address: {address}, {city}"
+
     def _run(self, query: str) -> str:
         """
         Search for outlets using natural language query.
@@ -36,11 +45,13 @@ class OutletSearchTool(BaseTool):
         """
         try:
             # Generate SQL from natural language
-            text2sql = get_text2sql_generator()
-            sql, params, metadata = text2sql.generate_sql(query)
+            sql, params, metadata = _text2sql.generate_sql(query)
             
-            # Execute query
-            with db.get_connection() as conn:
+            # Execute on a pooled read-only connection: these stay open
+            # for the process lifetime with cached_statements, so the
+            # fixed SQL templates (stable strings via the memoized
+            # generator) hit SQLite's prepared-statement cache
+            with db.get_read_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(sql, params)
                 results = cursor.fetchall()
@@ -56,7 +67,7 @@ class OutletSearchTool(BaseTool):
             
             # Format results based on query type
             if metadata["query_type"] == "count":
-                count = results[0]["count"] if isinstance(results[0], dict) else results[0][0]
+                count = results[0]["count"]
                 location = metadata.get("location", "")
                 return f"There are **{count} outlets** in {location}."
             
@@ -87,16 +98,13 @@ class OutletSearchTool(BaseTool):
         """Format outlet results into a readable response."""
         query_type = metadata.get("query_type")
         
-        # Handle operating hours specially
+        # Handle operating hours specially. The pool sets
+        # row_factory=sqlite3.Row, so rows are always addressable by
+        # column name - no per-field type sniffing or index fallbacks.
         if query_type == "operating_hours":
             response_parts = ["Here are the operating hours:\n"]
             for row in results[:3]:  # Limit to top 3 matches
-                outlet_name = row["outlet_name"] if isinstance(row, dict) else row[1]
-                city = row["city"] if isinstance(row, dict) else row[3]
-                hours = row["operating_hours"] if isinstance(row, dict) else row[4]
-                
-                response_parts.append(f"\n**{outlet_name}** ({city})")
-                response_parts.append(f"Hours: {hours}")
+                response_parts.append(self._HOURS_ROW_TMPL.format_map(row))
             
             return '\n'.join(response_parts)
         
@@ -108,45 +116,31 @@ class OutletSearchTool(BaseTool):
         count = len(results)
         response_parts = [f"I found **{count} outlet{'s' if count != 1 else ''}**{location_info}:\n"]
         
+        # One formatted block (and one append) per outlet instead of
+        # 4-7 appends each - fewer interpreter round-trips per row
         for idx, row in enumerate(results[:10], 1):  # Limit to 10 results
-            # Handle both dict and tuple results
-            if isinstance(row, dict):
-                outlet_name = row["outlet_name"]
-                address = row["address"]
-                city = row["city"]
-                state = row.get("state", "")
-                phone = row.get("phone", "")
-                hours = row.get("operating_hours", "")
-                has_drive_thru = row.get("has_drive_thru", False)
-                has_wifi = row.get("has_wifi", False)
-            else:
-                outlet_name = row[1]
-                address = row[2]
-                city = row[3]
-                state = row[4] if len(row) > 4 else ""
-                phone = row[5] if len(row) > 5 else ""
-                hours = row[6] if len(row) > 6 else ""
-                has_drive_thru = row[7] if len(row) > 7 else False
-                has_wifi = row[8] if len(row) > 8 else False
-            
-            response_parts.append(f"\n{idx}. **{outlet_name}**")
-            response_parts.append(f"   Address: {address}, {city}")
-            
+            phone = row["phone"]
+            hours = row["operating_hours"]
+
+            block = f"\n{idx}. " + self._OUTLET_ROW_TMPL.format_map(row)
+
             if phone:
-                response_parts.append(f"   Phone: {phone}")
-            
+                block += f"\n   Phone: {phone}"
+
             if hours:
-                response_parts.append(f"   Hours: {hours}")
-            
+                block += f"\n   Hours: {hours}"
+
             # Add features
             features = []
-            if has_drive_thru:
+            if row["has_drive_thru"]:
                 features.append("Drive-Through")
-            if has_wifi:
+            if row["has_wifi"]:
                 features.append("WiFi")
-            
+
             if features:
-                response_parts.append(f"   Features: {', '.join(features)}")
+                block += f"\n   Features: {', '.join(features)}"
+
+            response_parts.append(block)
         
         if count > 10:
             response_parts.append(f"\n... and {count - 10} more outlets.")
@@ -157,3 +151,7 @@ class OutletSearchTool(BaseTool):
         """Use the tool asynchronously."""
         return self._run(query)
 
+
+# Shared instance - the tool is stateless, so agents reuse it
+outlet_search_tool = OutletSearchTool()
+
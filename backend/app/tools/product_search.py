@@ -1,10 +1,53 @@
 """Product search tool using RAG (Retrieval Augmented Generation)."""
+from functools import lru_cache
 from typing import Any, Optional, Type
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
 from app.rag.simple_embedder import get_vector_store
 
+_NO_RESULTS_MSG = (
+    "I couldn't find any products matching your query. "
+    "We have tumblers, bottles, mugs, and other drinkware available."
+)
+
+
+@lru_cache(maxsize=256)
+def _search_response(query: str) -> str:
+    """Search and format products for a normalized query (memoized).
+
+    The catalog is fixed for the process lifetime and search is
+    deterministic, so the fully formatted reply can be cached - repeat
+    'tumbler'/'cup' queries skip embedding and formatting entirely.
+    """
+    results = get_vector_store().search(query, top_k=3)
+
+    if not results:
+        return _NO_RESULTS_MSG
+
+    # Format results into a readable response
+    response_parts = [f"I found {len(results)} products that match your query:\n"]
+
+    for idx, product in enumerate(results, 1):
+        response_parts.append(f"\n{idx}. **{product['name']}**")
+        response_parts.append(f"   - Price: RM {product['price_myr']:.2f}")
+        response_parts.append(f"   - Capacity: {product['capacity_ml']}ml")
+        response_parts.append(f"   - Material: {product['material']}")
+
+        if product.get('colors'):
+            colors = ', '.join(product['colors'][:3])  # Show first 3 colors
+            response_parts.append(f"   - Colors: {colors}")
+
+        if product.get('description'):
+            # Show first 100 chars of description
+            desc = product['description'][:100] + "..." if len(product['description']) > 100 else product['description']
+            response_parts.append(f"   - Description: {desc}")
+
+        if product.get('in_stock') is False:
+            response_parts.append(f"   - **Currently out of stock**")
+
+    return '\n'.join(response_parts)
+
 
 class ProductSearchInput(BaseModel):
     """Input for ProductSearchTool."""
@@ -34,35 +77,14 @@ class ProductSearchTool(BaseTool):
             Formatted string with product information
         """
         try:
-            vector_store = get_vector_store()
-            results = vector_store.search(query, top_k=3)
-            
-            if not results:
-                return "I couldn't find any products matching your query. We have tumblers, bottles, mugs, and other drinkware available."
-            
-            # Format results into a readable response
-            response_parts = [f"I found {len(results)} products that match your query:\n"]
-            
-            for idx, product in enumerate(results, 1):
-                response_parts.append(f"\n{idx}. **{product['name']}**")
-                response_parts.append(f"   - Price: RM {product['price_myr']:.2f}")
-                response_parts.append(f"   - Capacity: {product['capacity_ml']}ml")
-                response_parts.append(f"   - Material: {product['material']}")
-                
-                if product.get('colors'):
-                    colors = ', '.join(product['colors'][:3])  # Show first 3 colors
-                    response_parts.append(f"   - Colors: {colors}")
-                
-                if product.get('description'):
-                    # Show first 100 chars of description
-                    desc = product['description'][:100] + "..." if len(product['description']) > 100 else product['description']
-                    response_parts.append(f"   - Description: {desc}")
-                
-                if product.get('in_stock') is False:
-                    response_parts.append(f"   - **Currently out of stock**")
-            
-            return '\n'.join(response_parts)
-            
+            # Normalize so 'Tumbler' / ' tumbler ' share a cache entry;
+            # whitespace queries skip the vector store entirely
+            normalized = query.lower().strip()
+            if not normalized:
+                return _NO_RESULTS_MSG
+
+            return _search_response(normalized)
+
         except Exception as e:
             print(f"Error in product search: {e}")
             return f"I encountered an error while searching for products: {str(e)}"
@@ -71,3 +93,7 @@ class ProductSearchTool(BaseTool):
         """Use the tool asynchronously."""
         return self._run(query)
 
+
+# Shared instance - the tool is stateless, so agents reuse it
+product_search_tool = ProductSearchTool()
+
@@ -19,15 +19,34 @@ from app.agents.tool_agent import ToolAgent
 from app.agents.memory_store import memory_store
 
 
+async def warm_up():
+    """Build the slow singletons concurrently before the first question.
+
+    The Text2SQL generator, vector store and DB pool are independent, so
+    first-response latency drops to the max of the three instead of the
+    sum.
+    """
+    from app.rag.simple_embedder import get_vector_store
+    from app.text2sql.query_generator import get_text2sql_generator
+    from app.db import database
+
+    await asyncio.gather(
+        asyncio.to_thread(get_vector_store),
+        asyncio.to_thread(get_text2sql_generator),
+        asyncio.to_thread(lambda: database.db),
+    )
+
+
 async def interactive_demo():
     """Interactive chat demo."""
-    
+
     # Create a session
     session_id, memory = memory_store.get_or_create_session()
-    
-    # Create agent
+
+    # Create agent once, reused for every turn
     agent = ToolAgent(memory)
-    
+    await warm_up()
+
     print("\n" + "="*60)
     print("🎭 ConvoSage Interactive Demo (Mock LLM)")
     print("="*60)
@@ -41,8 +60,8 @@ async def interactive_demo():
     
     while True:
         try:
-            # Get user input
-            user_input = input("You: ").strip()
+            # Read input on a worker thread so the event loop stays free
+            user_input = (await asyncio.to_thread(input, "You: ")).strip()
             
             if not user_input:
                 continue
@@ -70,10 +89,11 @@ async def quick_demo():
     
     # Create a session
     session_id, memory = memory_store.get_or_create_session()
-    
-    # Create agent
+
+    # Create agent once, reused for every question
     agent = ToolAgent(memory)
-    
+    await warm_up()
+
     print("\n" + "="*60)
     print("🎭 ConvoSage Quick Demo (Mock LLM)")
     print("="*60 + "\n")
@@ -8,6 +8,47 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.db.database import db
 
+# One statement per row instead of SELECT + INSERT-or-UPDATE: the
+# UPSERT lets SQLite resolve existence itself, and executemany keeps
+# the whole batch inside a single prepared statement
+_UPSERT_OUTLET = """
+    INSERT INTO outlets (
+        outlet_id, outlet_name, address, city, state, postcode,
+        latitude, longitude, phone, operating_hours,
+        has_drive_thru, has_wifi, seating_capacity, opening_date
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(outlet_id) DO UPDATE SET
+        outlet_name = excluded.outlet_name,
+        address = excluded.address,
+        city = excluded.city,
+        state = excluded.state,
+        postcode = excluded.postcode,
+        latitude = excluded.latitude,
+        longitude = excluded.longitude,
+        phone = excluded.phone,
+        operating_hours = excluded.operating_hours,
+        has_drive_thru = excluded.has_drive_thru,
+        has_wifi = excluded.has_wifi,
+        seating_capacity = excluded.seating_capacity,
+        opening_date = excluded.opening_date,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+
+# Secondary indexes maintained by init_db. Dropping them for the bulk
+# load means each upsert only touches the primary-key B-tree; init_db
+# recreates them in one pass afterwards, which is cheaper than
+# maintaining every index row-by-row during the load.
+_SECONDARY_INDEXES = (
+    'idx_outlets_city',
+    'idx_outlets_state',
+    'idx_outlets_drive_thru',
+    'idx_outlets_state_city_dt',
+    'idx_outlets_city_nocase',
+    'idx_outlets_city_lower',
+    'idx_outlets_state_lower',
+)
+
 
 def ingest_outlets(csv_path: str):
     """
@@ -21,93 +62,56 @@ def ingest_outlets(csv_path: str):
     # Initialize database schema
     db.init_db()
     
-    # Read and insert data
-    inserted_count = 0
-    updated_count = 0
-    
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-        
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            
-            for row in reader:
-                # Convert string booleans to actual booleans
-                row['has_drive_thru'] = row['has_drive_thru'].upper() == 'TRUE'
-                row['has_wifi'] = row['has_wifi'].upper() == 'TRUE'
-                
-                # Check if outlet already exists
-                cursor.execute(
-                    "SELECT outlet_id FROM outlets WHERE outlet_id = ?",
-                    (row['outlet_id'],)
-                )
-                exists = cursor.fetchone()
-                
-                if exists:
-                    # Update existing record
-                    cursor.execute("""
-                        UPDATE outlets SET
-                            outlet_name = ?,
-                            address = ?,
-                            city = ?,
-                            state = ?,
-                            postcode = ?,
-                            latitude = ?,
-                            longitude = ?,
-                            phone = ?,
-                            operating_hours = ?,
-                            has_drive_thru = ?,
-                            has_wifi = ?,
-                            seating_capacity = ?,
-                            opening_date = ?,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE outlet_id = ?
-                    """, (
-                        row['outlet_name'],
-                        row['address'],
-                        row['city'],
-                        row['state'],
-                        row['postcode'],
-                        row['latitude'],
-                        row['longitude'],
-                        row['phone'],
-                        row['operating_hours'],
-                        row['has_drive_thru'],
-                        row['has_wifi'],
-                        row['seating_capacity'],
-                        row['opening_date'],
-                        row['outlet_id']
-                    ))
-                    updated_count += 1
-                else:
-                    # Insert new record
-                    cursor.execute("""
-                        INSERT INTO outlets (
-                            outlet_id, outlet_name, address, city, state, postcode,
-                            latitude, longitude, phone, operating_hours,
-                            has_drive_thru, has_wifi, seating_capacity, opening_date
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        row['outlet_id'],
-                        row['outlet_name'],
-                        row['address'],
-                        row['city'],
-                        row['state'],
-                        row['postcode'],
-                        row['latitude'],
-                        row['longitude'],
-                        row['phone'],
-                        row['operating_hours'],
-                        row['has_drive_thru'],
-                        row['has_wifi'],
-                        row['seating_capacity'],
-                        row['opening_date']
-                    ))
-                    inserted_count += 1
-    
+    # Stream rows with csv.reader and a header->index map instead of
+    # DictReader: no dict allocation per row, and the 1 MiB read buffer
+    # pulls the file in large chunks instead of the default 8 KiB. The
+    # generator feeds executemany directly, so memory stays flat no
+    # matter how large the feed grows.
+    with open(csv_path, 'r', encoding='utf-8', newline='', buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        col = {name: i for i, name in enumerate(header)}
+        fields = [
+            col[name] for name in (
+                'outlet_id', 'outlet_name', 'address', 'city', 'state',
+                'postcode', 'latitude', 'longitude', 'phone',
+                'operating_hours',
+            )
+        ]
+        dt, wifi, seats, opened = (
+            col['has_drive_thru'], col['has_wifi'],
+            col['seating_capacity'], col['opening_date'],
+        )
+        rows = (
+            tuple(row[i] for i in fields) + (
+                row[dt].upper() == 'TRUE',
+                row[wifi].upper() == 'TRUE',
+                row[seats],
+                row[opened],
+            )
+            for row in reader
+            if row  # csv.reader yields [] for blank lines; DictReader skipped them
+        )
+
+        # One explicit transaction around the whole batch: a single
+        # fsync at commit instead of one per row, and IMMEDIATE takes
+        # the write lock up front rather than mid-batch. WAL +
+        # synchronous=NORMAL are already set when Database opens the
+        # writer connection, so readers (e.g. a running test suite)
+        # aren't blocked while this commits.
+        with db.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.cursor()
+            for index_name in _SECONDARY_INDEXES:
+                cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+            cursor.executemany(_UPSERT_OUTLET, rows)
+            processed = cursor.rowcount
+
+    # Rebuild the secondary indexes in one pass over the loaded table
+    db.init_db()
+
     print(f"✅ Ingestion complete!")
-    print(f"   - Inserted: {inserted_count} new outlets")
-    print(f"   - Updated: {updated_count} existing outlets")
+    print(f"   - Processed: {processed} outlets (inserted or updated)")
     print(f"   - Total in database: {db.get_table_count('outlets')}")
 
 
@@ -0,0 +1,117 @@
+"""Shared fixtures for the backend test suite."""
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow", action="store_true", default=False,
+        help="also run tests marked slow (e.g. rate-limit stress)"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: slow stress test, needs --run-slow")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient for the whole run.
+
+    Entering the client runs the app's lifespan (vector store warmup,
+    DB init) exactly once, instead of once per test module that used
+    to build its own TestClient at import time.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session", autouse=True)
+def seeded_database():
+    """Make sure the outlets table is loaded once per session.
+
+    The database singleton and its read-only pool bind to the on-disk
+    file at import time, so tests share the process-lifetime page
+    cache; what a fresh checkout lacks is the seeded data. Load the
+    CSV through the ingest script's batch upsert if the table is
+    empty, instead of requiring a manual ingest step before pytest.
+    """
+    from app.db.database import db
+    from scripts.ingest_outlets import ingest_outlets
+
+    db.init_db()
+    if db.get_table_count("outlets") == 0:
+        csv_path = Path(__file__).parent.parent.parent / "data" / "outlets.csv"
+        ingest_outlets(str(csv_path))
+    return db
+
+
+@pytest.fixture(scope="session", autouse=True)
+def force_mock_llm():
+    """Pin the suite to the deterministic MockLLM.
+
+    Agents are built lazily per chat request, so flipping the setting
+    here (before any request runs) guarantees the multi-turn
+    conversation tests never reach a real model, even when a local
+    .env sets USE_MOCK_LLM=False.
+    """
+    from app.config import settings
+
+    original = settings.USE_MOCK_LLM
+    settings.USE_MOCK_LLM = True
+    yield
+    settings.USE_MOCK_LLM = original
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_app(client, force_mock_llm):
+    """Prime one-time lazy initialization before any test runs.
+
+    /health makes the first routed request happen at a predictable
+    point, and one throwaway /chat/ turn forces the lazily imported
+    agent stack (LangChain memory, tools, MockLLM) to load here
+    rather than inside whichever chat test happens to run first.
+    The session it creates is dropped so tests start from an empty
+    store.
+    """
+    from app.agents.memory_store import memory_store
+
+    client.get("/health")
+    client.post("/chat/", json={"message": "hi"})
+    memory_store.reset()
+
+
+@pytest_asyncio.fixture
+async def async_client():
+    """An httpx AsyncClient speaking ASGI directly to the app.
+
+    Multi-call tests issue all their requests inside one connection
+    context on one event loop, instead of spinning the sync
+    TestClient's portal up and down per call.
+    """
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture(scope="session")
+def vector_store():
+    """The product vector store singleton, resolved once per run."""
+    from app.rag.simple_embedder import get_vector_store
+
+    return get_vector_store()
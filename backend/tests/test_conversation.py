@@ -1,12 +1,9 @@
 """Tests for conversation memory and chat endpoint."""
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
 
-client = TestClient(app)
 
 
-def test_chat_without_session_id():
+def test_chat_without_session_id(client):
     """Test chat endpoint creates new session when no session_id provided."""
     response = client.post("/chat/", json={
         "message": "Hello, who are you?"
@@ -27,7 +24,7 @@ def test_chat_without_session_id():
     assert len(data["response"]) > 0
 
 
-def test_chat_with_session_id():
+def test_chat_with_session_id(client):
     """Test chat endpoint uses provided session_id."""
     session_id = "test-session-123"
     
@@ -43,26 +40,31 @@ def test_chat_with_session_id():
     assert data["session_id"] == session_id
 
 
-def test_conversation_memory_multi_turn():
-    """Test that conversation remembers context across turns."""
+@pytest.mark.asyncio
+async def test_conversation_memory_multi_turn(async_client):
+    """Test that conversation remembers context across turns.
+
+    Uses the async client so all three turns share one connection
+    context and event loop.
+    """
     session_id = "test-memory-session"
-    
+
     # Turn 1: Introduce name
-    response1 = client.post("/chat/", json={
+    response1 = await async_client.post("/chat/", json={
         "message": "Hi, my name is Alice",
         "session_id": session_id
     })
     assert response1.status_code == 200
-    
+
     # Turn 2: Ask about something else
-    response2 = client.post("/chat/", json={
+    response2 = await async_client.post("/chat/", json={
         "message": "What's the weather like?",
         "session_id": session_id
     })
     assert response2.status_code == 200
-    
+
     # Turn 3: Ask about name (should remember from Turn 1)
-    response3 = client.post("/chat/", json={
+    response3 = await async_client.post("/chat/", json={
         "message": "What's my name?",
         "session_id": session_id
     })
@@ -74,7 +76,7 @@ def test_conversation_memory_multi_turn():
     assert len(data3["response"]) > 0
 
 
-def test_get_conversation_history():
+def test_get_conversation_history(client):
     """Test retrieving conversation history."""
     session_id = "test-history-session"
     
@@ -103,7 +105,7 @@ def test_get_conversation_history():
     assert len(data["history"]) > 0
 
 
-def test_delete_session():
+def test_delete_session(client):
     """Test deleting a session."""
     session_id = "test-delete-session"
     
@@ -122,7 +124,7 @@ def test_delete_session():
     assert history_response.status_code == 404
 
 
-def test_get_stats():
+def test_get_stats(client):
     """Test getting session statistics."""
     response = client.get("/chat/stats")
     assert response.status_code == 200
@@ -132,7 +134,7 @@ def test_get_stats():
     assert isinstance(data["active_sessions"], int)
 
 
-def test_chat_empty_message():
+def test_chat_empty_message(client):
     """Test chat with empty message fails validation."""
     response = client.post("/chat/", json={
         "message": ""
@@ -142,7 +144,7 @@ def test_chat_empty_message():
     assert response.status_code == 422
 
 
-def test_interrupted_conversation():
+def test_interrupted_conversation(client):
     """Test that memory persists even with gaps in conversation."""
     session_id = "test-interrupted-session"
     
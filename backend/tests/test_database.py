@@ -1,9 +1,4 @@
 """Tests for database operations."""
-import sys
-from pathlib import Path
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.db.database import db
 
@@ -1,12 +1,9 @@
 """Test health check endpoint."""
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
 
-client = TestClient(app)
 
 
-def test_health_check():
+def test_health_check(client):
     """Test that health check endpoint returns 200."""
     response = client.get("/health")
     assert response.status_code == 200
@@ -16,7 +13,7 @@ def test_health_check():
     assert "version" in data
 
 
-def test_root_endpoint():
+def test_root_endpoint(client):
     """Test that root endpoint returns welcome message."""
     response = client.get("/")
     assert response.status_code == 200
@@ -1,30 +1,28 @@
 """Tests for outlet search and Text2SQL functionality."""
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
-from app.main import app
+def _search(client, query):
+    """POST a search query and return the decoded payload.
 
-client = TestClient(app)
+    Every search test shares the same envelope assertions (HTTP 200,
+    query echoed back), so they live here once.
+    """
+    response = client.post("/outlets/search", json={"query": query})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["query"] == query
+    return data
 
 
-def test_outlet_search_by_city():
+def test_outlet_search_by_city(client):
     """Test searching for outlets by city."""
-    response = client.post("/outlets/search", json={
-        "query": "Find outlets in Petaling Jaya"
-    })
-    
-    assert response.status_code == 200
-    data = response.json()
-    
-    assert data["query"] == "Find outlets in Petaling Jaya"
+    data = _search(client, "Find outlets in Petaling Jaya")
+
     assert data["total_results"] > 0
     assert "sql_generated" in data
     assert "SELECT" in data["sql_generated"]
-    
+
     # Check that results have required fields
     for result in data["results"]:
         assert "outlet_name" in result
@@ -32,92 +30,82 @@ def test_outlet_search_by_city():
         assert "city" in result
 
 
-def test_outlet_search_drive_thru():
-    """Test searching for outlets with drive-through."""
-    response = client.post("/outlets/search", json={
-        "query": "Which outlets have drive-through?"
-    })
-    
-    assert response.status_code == 200
-    data = response.json()
-    
-    assert data["total_results"] > 0
-    # All results should have drive_thru
-    for result in data["results"]:
-        assert result["has_drive_thru"] is True
-
+@pytest.mark.parametrize("query,flag", [
+    ("Which outlets have drive-through?", "has_drive_thru"),
+    ("outlets with WiFi", "has_wifi"),
+])
+def test_outlet_search_by_feature(client, query, flag):
+    """Test feature searches return only outlets with that feature."""
+    data = _search(client, query)
 
-def test_outlet_search_wifi():
-    """Test searching for outlets with WiFi."""
-    response = client.post("/outlets/search", json={
-        "query": "outlets with WiFi"
-    })
-    
-    assert response.status_code == 200
-    data = response.json()
-    
-    # All results should have WiFi
+    assert data["total_results"] > 0
     for result in data["results"]:
-        assert result["has_wifi"] is True
+        assert result[flag] is True
 
 
-def test_outlet_search_combined():
+def test_outlet_search_combined(client):
     """Test combined search (location + feature)."""
-    response = client.post("/outlets/search", json={
-        "query": "outlets in Selangor with WiFi"
-    })
-    
-    assert response.status_code == 200
-    data = response.json()
-    
+    data = _search(client, "outlets in Selangor with WiFi")
+
     # Should have results in Selangor with WiFi
     for result in data["results"]:
         assert result["state"].lower() == "selangor" or result["city"].lower() == "selangor"
         assert result["has_wifi"] is True
 
 
-def test_outlet_search_count():
+def test_outlet_search_count(client):
     """Test count queries."""
-    response = client.post("/outlets/search", json={
-        "query": "How many outlets are there in Kuala Lumpur?"
-    })
-    
-    assert response.status_code == 200
-    data = response.json()
-    
+    data = _search(client, "How many outlets are there in Kuala Lumpur?")
+
     # Count queries return total in metadata
     assert data["total_results"] >= 0
     assert data["query_metadata"]["query_type"] == "count"
 
 
-def test_outlet_search_invalid_location():
+def test_outlet_search_invalid_location(client):
     """Test searching for outlets in invalid location."""
-    response = client.post("/outlets/search", json={
-        "query": "outlets in InvalidCity123"
-    })
-    
-    assert response.status_code == 200
-    data = response.json()
-    
+    data = _search(client, "outlets in InvalidCity123")
+
     # Should return 0 results for invalid location
     assert data["total_results"] == 0
     assert data["query_metadata"]["valid"] is False
 
 
-def test_outlet_search_sql_injection():
+def test_outlet_search_sql_injection(client):
     """Test that SQL injection is prevented."""
-    response = client.post("/outlets/search", json={
-        "query": "outlets in '; DROP TABLE outlets; --"
-    })
-    
-    assert response.status_code == 200
-    data = response.json()
-    
+    data = _search(client, "outlets in '; DROP TABLE outlets; --")
+
     # Should safely return 0 results
     assert data["total_results"] == 0
 
 
-def test_get_all_outlets():
+def test_outlet_search_injection_fast_path(client):
+    """Test that injection markers short-circuit before SQL generation."""
+    data = _search(client, "'; DROP TABLE outlets; --")
+
+    # Rejected queries never reach the generator or the database
+    assert data["total_results"] == 0
+    assert data["sql_generated"] == ""
+    assert data["query_metadata"]["query_type"] == "rejected"
+    assert data["query_metadata"]["valid"] is False
+
+
+@pytest.mark.parametrize("query", [
+    "What's the operating hours for SS2 outlet?",
+    "give me an update on outlets in KL",
+])
+def test_outlet_search_prefilter_allows_valid_queries(client, query):
+    """Test that contractions and everyday words pass the prefilter."""
+    data = _search(client, query)
+
+    # These queries dispatched to the generator before the prefilter
+    # existed, so the fast path must not intercept them
+    assert data["query_metadata"]["query_type"] != "rejected"
+    assert data["query_metadata"]["valid"] is True
+    assert data["sql_generated"] != ""
+
+
+def test_get_all_outlets(client):
     """Test getting all outlets."""
     response = client.get("/outlets/")
     
@@ -135,7 +123,7 @@ def test_get_all_outlets():
         assert "city" in outlet
 
 
-def test_get_outlet_by_id():
+def test_get_outlet_by_id(client):
     """Test getting a specific outlet by ID."""
     response = client.get("/outlets/OUT001")
     
@@ -147,14 +135,14 @@ def test_get_outlet_by_id():
     assert "address" in outlet
 
 
-def test_get_nonexistent_outlet():
+def test_get_nonexistent_outlet(client):
     """Test getting an outlet that doesn't exist."""
     response = client.get("/outlets/INVALID")
     
     assert response.status_code == 404
 
 
-def test_chat_with_outlet_query():
+def test_chat_with_outlet_query(client):
     """Test that chat endpoint works with outlet queries."""
     response = client.post("/chat/", json={
         "message": "Where are the outlets in Petaling Jaya?"
@@ -169,7 +157,7 @@ def test_chat_with_outlet_query():
     assert any(word in response_text for word in ["outlet", "address", "petaling jaya", "found"])
 
 
-def test_chat_mixed_outlet_and_product():
+def test_chat_mixed_outlet_and_product(client):
     """Test chat with both outlet and product queries."""
     # First, ask about outlets
     response1 = client.post("/chat/", json={
@@ -205,15 +193,10 @@ def test_outlet_tool_integration():
     assert len(result) > 0
 
 
-def test_outlet_search_operating_hours():
+def test_outlet_search_operating_hours(client):
     """Test querying for operating hours."""
-    response = client.post("/outlets/search", json={
-        "query": "What are the operating hours for SS2 outlet?"
-    })
-    
-    assert response.status_code == 200
-    data = response.json()
-    
+    data = _search(client, "What are the operating hours for SS2 outlet?")
+
     # Should return outlets matching SS2
     assert data["total_results"] >= 0
 
@@ -1,18 +1,6 @@
 """Tests for product search and RAG functionality."""
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from app.main import app
-from app.rag.simple_embedder import get_vector_store
-
-client = TestClient(app)
-
-
-def test_product_search_tumbler():
+def test_product_search_tumbler(client):
     """Test searching for tumblers."""
     response = client.post("/products/search", json={
         "query": "tumbler",
@@ -34,7 +22,7 @@ def test_product_search_tumbler():
     assert "similarity_score" in first_result
 
 
-def test_product_search_large_bottle():
+def test_product_search_large_bottle(client):
     """Test searching for large bottles."""
     response = client.post("/products/search", json={
         "query": "large water bottle",
@@ -50,7 +38,7 @@ def test_product_search_large_bottle():
         assert result["capacity_ml"] >= 500
 
 
-def test_product_search_glass():
+def test_product_search_glass(client):
     """Test searching for glass products."""
     response = client.post("/products/search", json={
         "query": "glass cup",
@@ -65,7 +53,7 @@ def test_product_search_glass():
                for result in data["results"])
 
 
-def test_get_all_products():
+def test_get_all_products(client):
     """Test getting all products."""
     response = client.get("/products/")
     
@@ -82,7 +70,7 @@ def test_get_all_products():
         assert "price_myr" in product
 
 
-def test_get_product_by_id():
+def test_get_product_by_id(client):
     """Test getting a specific product."""
     response = client.get("/products/DW001")
     
@@ -94,14 +82,14 @@ def test_get_product_by_id():
     assert "price_myr" in product
 
 
-def test_get_nonexistent_product():
+def test_get_nonexistent_product(client):
     """Test getting a product that doesn't exist."""
     response = client.get("/products/INVALID")
     
     assert response.status_code == 404
 
 
-def test_product_search_invalid_top_k():
+def test_product_search_invalid_top_k(client):
     """Test product search with invalid top_k."""
     response = client.post("/products/search", json={
         "query": "tumbler",
@@ -112,19 +100,17 @@ def test_product_search_invalid_top_k():
     assert response.status_code == 422
 
 
-def test_vector_store_initialization():
+def test_vector_store_initialization(vector_store):
     """Test that vector store initializes correctly."""
-    vs = get_vector_store()
-    
+    vs = vector_store
     assert vs is not None
     assert len(vs.products) == 8
     assert len(vs.product_vectors) == 8
 
 
-def test_vector_store_search():
+def test_vector_store_search(vector_store):
     """Test vector store search functionality."""
-    vs = get_vector_store()
-    
+    vs = vector_store
     results = vs.search("stainless steel tumbler", top_k=2)
     
     assert len(results) <= 2
@@ -134,7 +120,7 @@ def test_vector_store_search():
         assert results[0]["similarity_score"] >= results[1]["similarity_score"]
 
 
-def test_chat_with_product_query():
+def test_chat_with_product_query(client):
     """Test that chat endpoint works with product queries."""
     response = client.post("/chat/", json={
         "message": "What tumblers do you have?"
@@ -148,7 +134,7 @@ def test_chat_with_product_query():
     assert any(word in data["response"].lower() for word in ["tumbler", "product", "rm"])
 
 
-def test_chat_mixed_queries():
+def test_chat_mixed_queries(client):
     """Test chat with mixed calculator and product queries."""
     # First, ask about products
     response1 = client.post("/chat/", json={
@@ -1,23 +1,23 @@
 """Tests for the tool agent with calculator."""
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
 from app.agents.memory_store import memory_store
 
-client = TestClient(app)
 
 
 @pytest.fixture(autouse=True)
-def clear_memory_before_each_test():
-    """Clear all sessions before each test."""
-    memory_store._sessions.clear()
-    memory_store._session_metadata.clear()
+def clear_memory_after_each_test():
+    """Reset the session store once per test, after it runs.
+
+    Post-test cleanup alone is enough - every test leaves the store
+    empty for the next one, halving the clears of the old
+    before-and-after version and going through the public reset()
+    instead of the private dicts.
+    """
     yield
-    memory_store._sessions.clear()
-    memory_store._session_metadata.clear()
+    memory_store.reset()
 
 
-def test_calculator_request():
+def test_calculator_request(client):
     """Test that agent uses calculator for math requests."""
     response = client.post("/chat/", json={
         "message": "Calculate 5+3 for me"
@@ -27,7 +27,7 @@ def test_calculator_request():
     assert "8" in data["response"]
 
 
-def test_calculator_what_is():
+def test_calculator_what_is(client):
     """Test calculator with 'what is' phrasing."""
     response = client.post("/chat/", json={
         "message": "What is 10*2?"
@@ -37,7 +37,7 @@ def test_calculator_what_is():
     assert "20" in data["response"]
 
 
-def test_calculator_compute():
+def test_calculator_compute(client):
     """Test calculator with 'compute' keyword."""
     response = client.post("/chat/", json={
         "message": "Compute 15 + 7"
@@ -47,7 +47,7 @@ def test_calculator_compute():
     assert "22" in data["response"]
 
 
-def test_calculator_complex_expression():
+def test_calculator_complex_expression(client):
     """Test calculator with complex expression."""
     response = client.post("/chat/", json={
         "message": "Calculate (5+3)*2"
@@ -57,7 +57,7 @@ def test_calculator_complex_expression():
     assert "16" in data["response"]
 
 
-def test_normal_conversation_still_works():
+def test_normal_conversation_still_works(client):
     """Test that normal conversation (non-calculation) still works."""
     response = client.post("/chat/", json={
         "message": "Hello! My name is Bob."
@@ -69,7 +69,7 @@ def test_normal_conversation_still_works():
     assert "result" not in data["response"].lower() or "Bob" in data["response"]
 
 
-def test_mixed_conversation():
+def test_mixed_conversation(client):
     """Test switching between conversation and calculation."""
     # Start with greeting
     response1 = client.post("/chat/", json={
@@ -92,7 +92,7 @@ def test_mixed_conversation():
     assert response3.status_code == 200
 
 
-def test_calculator_error_handling():
+def test_calculator_error_handling(client):
     """Test calculator handles errors gracefully."""
     response = client.post("/chat/", json={
         "message": "Calculate 5/0"
@@ -102,7 +102,7 @@ def test_calculator_error_handling():
     assert "Error" in data["response"] or "zero" in data["response"].lower()
 
 
-def test_agent_detects_inline_math():
+def test_agent_detects_inline_math(client):
     """Test agent detects math expressions inline."""
     response = client.post("/chat/", json={
         "message": "I need to know 15+20"
@@ -113,7 +113,7 @@ def test_agent_detects_inline_math():
     assert "35" in data["response"]
 
 
-def test_no_calculation_without_math():
+def test_no_calculation_without_math(client):
     """Test agent doesn't try to calculate when there's no math."""
     response = client.post("/chat/", json={
         "message": "What products does ZUS Coffee have?"
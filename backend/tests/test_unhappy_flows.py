@@ -1,20 +1,12 @@
 """Tests for unhappy flows, error handling, and edge cases."""
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from app.main import app
-
-client = TestClient(app)
 
+import pytest
 
 # ============================================================================
 # VALIDATION ERRORS
 # ============================================================================
 
-def test_empty_chat_message():
+def test_empty_chat_message(client):
     """Test sending empty message to chat."""
     response = client.post("/chat/", json={
         "message": ""
@@ -26,7 +18,7 @@ def test_empty_chat_message():
     assert data["error"]["code"] == "VALIDATION_ERROR"
 
 
-def test_missing_chat_message_field():
+def test_missing_chat_message_field(client):
     """Test chat request without message field."""
     response = client.post("/chat/", json={})
     
@@ -35,7 +27,7 @@ def test_missing_chat_message_field():
     assert "error" in data
 
 
-def test_invalid_product_search_top_k():
+def test_invalid_product_search_top_k(client):
     """Test product search with invalid top_k."""
     response = client.post("/products/search", json={
         "query": "tumbler",
@@ -45,7 +37,7 @@ def test_invalid_product_search_top_k():
     assert response.status_code == 422
 
 
-def test_empty_product_query():
+def test_empty_product_query(client):
     """Test product search with empty query."""
     response = client.post("/products/search", json={
         "query": ""
@@ -54,7 +46,7 @@ def test_empty_product_query():
     assert response.status_code == 422
 
 
-def test_empty_outlet_query():
+def test_empty_outlet_query(client):
     """Test outlet search with empty query."""
     response = client.post("/outlets/search", json={
         "query": ""
@@ -67,7 +59,7 @@ def test_empty_outlet_query():
 # CALCULATOR TOOL ERROR HANDLING
 # ============================================================================
 
-def test_calculator_empty_expression():
+def test_calculator_empty_expression(client):
     """Test calculator with empty expression."""
     response = client.post("/chat/", json={
         "message": "Calculate "
@@ -80,7 +72,7 @@ def test_calculator_empty_expression():
     assert len(data["response"]) > 0
 
 
-def test_calculator_division_by_zero():
+def test_calculator_division_by_zero(client):
     """Test calculator division by zero."""
     response = client.post("/chat/", json={
         "message": "Calculate 10 / 0"
@@ -91,7 +83,7 @@ def test_calculator_division_by_zero():
     assert "Division by zero" in data["response"] or "Error" in data["response"]
 
 
-def test_calculator_invalid_characters():
+def test_calculator_invalid_characters(client):
     """Test calculator with invalid characters."""
     response = client.post("/chat/", json={
         "message": "Calculate 5 + abc"
@@ -102,7 +94,7 @@ def test_calculator_invalid_characters():
     assert "Error" in data["response"] or "Invalid" in data["response"]
 
 
-def test_calculator_mismatched_parentheses():
+def test_calculator_mismatched_parentheses(client):
     """Test calculator with mismatched parentheses."""
     response = client.post("/chat/", json={
         "message": "Calculate (5 + 3"
@@ -113,7 +105,7 @@ def test_calculator_mismatched_parentheses():
     assert "Error" in data["response"] or "parentheses" in data["response"].lower()
 
 
-def test_calculator_overflow():
+def test_calculator_overflow(client):
     """Test calculator with overflow."""
     response = client.post("/chat/", json={
         "message": "Calculate 10 ** 10000"
@@ -129,7 +121,7 @@ def test_calculator_overflow():
 # MALICIOUS INPUTS
 # ============================================================================
 
-def test_sql_injection_outlet_search():
+def test_sql_injection_outlet_search(client):
     """Test SQL injection attempt in outlet search."""
     response = client.post("/outlets/search", json={
         "query": "'; DROP TABLE outlets; --"
@@ -143,7 +135,7 @@ def test_sql_injection_outlet_search():
     assert isinstance(data["results"], list)
 
 
-def test_sql_injection_with_union():
+def test_sql_injection_with_union(client):
     """Test SQL injection with UNION attempt."""
     response = client.post("/outlets/search", json={
         "query": "' UNION SELECT * FROM users --"
@@ -156,7 +148,7 @@ def test_sql_injection_with_union():
     assert isinstance(data["results"], list)
 
 
-def test_xss_attempt_in_chat():
+def test_xss_attempt_in_chat(client):
     """Test XSS attempt in chat message."""
     response = client.post("/chat/", json={
         "message": "<script>alert('XSS')</script>"
@@ -168,7 +160,7 @@ def test_xss_attempt_in_chat():
     assert "response" in data
 
 
-def test_very_long_input():
+def test_very_long_input(client):
     """Test with extremely long input."""
     long_message = "a" * 10000
     response = client.post("/chat/", json={
@@ -183,7 +175,7 @@ def test_very_long_input():
 # NOT FOUND ERRORS
 # ============================================================================
 
-def test_nonexistent_product():
+def test_nonexistent_product(client):
     """Test fetching nonexistent product."""
     response = client.get("/products/INVALID123")
     
@@ -192,7 +184,7 @@ def test_nonexistent_product():
     assert "error" in data
 
 
-def test_nonexistent_outlet():
+def test_nonexistent_outlet(client):
     """Test fetching nonexistent outlet."""
     response = client.get("/outlets/INVALID123")
     
@@ -201,7 +193,7 @@ def test_nonexistent_outlet():
     assert "error" in data
 
 
-def test_nonexistent_endpoint():
+def test_nonexistent_endpoint(client):
     """Test accessing nonexistent endpoint."""
     response = client.get("/nonexistent")
     
@@ -212,7 +204,7 @@ def test_nonexistent_endpoint():
 # INVALID LOCATION QUERIES
 # ============================================================================
 
-def test_invalid_city_name():
+def test_invalid_city_name(client):
     """Test outlet search with completely invalid city."""
     response = client.post("/outlets/search", json={
         "query": "outlets in InvalidCity123"
@@ -224,7 +216,7 @@ def test_invalid_city_name():
     assert data["query_metadata"]["valid"] is False
 
 
-def test_gibberish_outlet_query():
+def test_gibberish_outlet_query(client):
     """Test outlet search with gibberish."""
     response = client.post("/outlets/search", json={
         "query": "asdfghjkl qwertyuiop"
@@ -240,7 +232,7 @@ def test_gibberish_outlet_query():
 # SESSION MANAGEMENT ERRORS
 # ============================================================================
 
-def test_invalid_session_id():
+def test_invalid_session_id(client):
     """Test chat with invalid session ID format."""
     response = client.post("/chat/", json={
         "message": "Hello",
@@ -253,7 +245,7 @@ def test_invalid_session_id():
     assert "response" in data
 
 
-def test_delete_nonexistent_session():
+def test_delete_nonexistent_session(client):
     """Test deleting nonexistent session."""
     response = client.delete("/chat/session/nonexistent123")
     
@@ -261,7 +253,7 @@ def test_delete_nonexistent_session():
     assert response.status_code in [200, 404]
 
 
-def test_get_history_nonexistent_session():
+def test_get_history_nonexistent_session(client):
     """Test getting history for nonexistent session."""
     response = client.get("/chat/history/nonexistent123")
     
@@ -273,7 +265,8 @@ def test_get_history_nonexistent_session():
 # RATE LIMITING (if enabled)
 # ============================================================================
 
-def test_rate_limit_basic():
+@pytest.mark.slow
+def test_rate_limit_basic(client):
     """Test that rate limiting exists (may skip if disabled)."""
     # Make many requests quickly
     responses = []
@@ -289,7 +282,7 @@ def test_rate_limit_basic():
 # TOOL FAILURE SCENARIOS
 # ============================================================================
 
-def test_ambiguous_query():
+def test_ambiguous_query(client):
     """Test with ambiguous query that could match multiple tools."""
     response = client.post("/chat/", json={
         "message": "show me something"
@@ -300,7 +293,7 @@ def test_ambiguous_query():
     assert "response" in data
 
 
-def test_query_with_no_context():
+def test_query_with_no_context(client):
     """Test query that needs context but has none."""
     response = client.post("/chat/", json={
         "message": "What about that one?"
@@ -315,7 +308,7 @@ def test_query_with_no_context():
 # EDGE CASES
 # ============================================================================
 
-def test_zero_top_k_products():
+def test_zero_top_k_products(client):
     """Test product search with top_k = 0."""
     response = client.post("/products/search", json={
         "query": "tumbler",
@@ -325,7 +318,7 @@ def test_zero_top_k_products():
     assert response.status_code == 422  # Should be invalid
 
 
-def test_negative_top_k():
+def test_negative_top_k(client):
     """Test with negative top_k."""
     response = client.post("/products/search", json={
         "query": "tumbler",
@@ -335,7 +328,7 @@ def test_negative_top_k():
     assert response.status_code == 422
 
 
-def test_unicode_characters():
+def test_unicode_characters(client):
     """Test with Unicode characters."""
     response = client.post("/chat/", json={
         "message": "Hello 你好 مرحبا 🎉"
@@ -346,7 +339,7 @@ def test_unicode_characters():
     assert "response" in data
 
 
-def test_special_characters_in_query():
+def test_special_characters_in_query(client):
     """Test with special characters."""
     response = client.post("/outlets/search", json={
         "query": "outlets @ #location! $$$"
@@ -355,7 +348,7 @@ def test_special_characters_in_query():
     assert response.status_code == 200
 
 
-def test_only_whitespace_message():
+def test_only_whitespace_message(client):
     """Test with only whitespace."""
     response = client.post("/chat/", json={
         "message": "     "